@@ -375,3 +375,6 @@ async def scan_with_filter(
             f"❌ Ошибка при сканировании: {e}",
             reply_markup=main_keyboard
         )
+    finally:
+        # Браузеры, созданные для этого сканирования, закрываем сразу, не дожидаясь сборщика мусора
+        await listing_service.aclose()
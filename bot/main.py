@@ -29,49 +29,53 @@ async def periodic_check(context) -> None:
     """
     db = Database(settings.db_path)
     listing_service = ListingService(db)
-    users = db.get_all_users_with_filters()
-    
-    for user_id in users:
-        # Получаем все активные фильтры пользователя
-        active_filters = db.get_active_filters_for_user(user_id)
-        if not active_filters:
-            continue
-        
-        # Проверяем все активные фильтры
-        all_listings = []
-        for filter_item in active_filters:
-            filter_obj = ListingFilter(filter_item['filters'])
-            listings = await listing_service.fetch_and_filter_listings(
-                filter_obj,
-                user_id
-            )
-            all_listings.extend(listings)
-        
-        # Убираем дубликаты
-        seen_ids = set()
-        unique_listings = []
-        for listing in all_listings:
-            if listing['listing_id'] not in seen_ids:
-                seen_ids.add(listing['listing_id'])
-                unique_listings.append(listing)
+    try:
+        users = db.get_all_users_with_filters()
         
-        # Ограничиваем до 15 объявлений
-        listings_to_send = unique_listings[-15:] if len(unique_listings) > 15 else unique_listings
-        
-        if listings_to_send:
-            for listing in listings_to_send:
-                try:
-                    message_text = format_listing_message(listing)
-                    await context.bot.send_message(
-                        chat_id=user_id,
-                        text=message_text,
-                        parse_mode=ParseMode.HTML,
-                        disable_web_page_preview=False
-                    )
-                    db.mark_listing_sent(listing['listing_id'], user_id)
-                    await asyncio.sleep(1)  # Задержка между сообщениями
-                except Exception as e:
-                    logger.error(f"Ошибка отправки сообщения пользователю {user_id}: {e}")
+        for user_id in users:
+            # Получаем все активные фильтры пользователя
+            active_filters = db.get_active_filters_for_user(user_id)
+            if not active_filters:
+                continue
+            
+            # Проверяем все активные фильтры
+            all_listings = []
+            for filter_item in active_filters:
+                filter_obj = ListingFilter(filter_item['filters'])
+                listings = await listing_service.fetch_and_filter_listings(
+                    filter_obj,
+                    user_id
+                )
+                all_listings.extend(listings)
+            
+            # Убираем дубликаты
+            seen_ids = set()
+            unique_listings = []
+            for listing in all_listings:
+                if listing['listing_id'] not in seen_ids:
+                    seen_ids.add(listing['listing_id'])
+                    unique_listings.append(listing)
+            
+            # Ограничиваем до 15 объявлений
+            listings_to_send = unique_listings[-15:] if len(unique_listings) > 15 else unique_listings
+            
+            if listings_to_send:
+                for listing in listings_to_send:
+                    try:
+                        message_text = format_listing_message(listing)
+                        await context.bot.send_message(
+                            chat_id=user_id,
+                            text=message_text,
+                            parse_mode=ParseMode.HTML,
+                            disable_web_page_preview=False
+                        )
+                        db.mark_listing_sent(listing['listing_id'], user_id)
+                        await asyncio.sleep(1)  # Задержка между сообщениями
+                    except Exception as e:
+                        logger.error(f"Ошибка отправки сообщения пользователю {user_id}: {e}")
+    finally:
+        # Браузеры, созданные для этой проверки, закрываем сразу, не дожидаясь сборщика мусора
+        await listing_service.aclose()
 
 
 def create_application() -> Application:
@@ -44,7 +44,7 @@ def format_listing_message(listing: Dict) -> str:
     else:
         text += "<b>Цена:</b> Не указано\n"
     
-    text += f"<b>Арендодатель:</b> {listing.get('landlord', 'Не указано')}\n"
+    text += f"<b>Арендодатель:</b> {listing.get('landlord') or 'Не указано'}\n"
     text += f"<b>Источник:</b> {listing['source']}\n"
     
     # Форматирование ссылки - всегда показываем конкретную ссылку на объявление
@@ -1,8 +1,9 @@
 """Сервис для работы с объявлениями."""
+import asyncio
 import logging
-from typing import List, Dict
+from typing import List
 
-from parsers import OnlinerParser, KufarParser, RealtParser, DomovitaParser
+from parsers import OnlinerParser, KufarParser, RealtParser, DomovitaParser, Listing
 from parsers.selenium_base import SeleniumBaseParser
 from filters import ListingFilter
 from database import Database
@@ -29,11 +30,18 @@ class ListingService:
         self.realt_parser = RealtParser(selenium_parser=self._browser)
         self.domovita_parser = DomovitaParser(selenium_parser=self._browser)
     
+    async def aclose(self) -> None:
+        """Закрыть браузеры сервиса: окна Kufar и ссылку на общий Chromium (он закрывается с последней ссылкой)."""
+        await self.kufar_parser.aclose()
+        await self.onliner_parser.aclose()
+        loop = asyncio.get_event_loop()
+        await loop.run_in_executor(None, self._browser.close)
+    
     async def fetch_and_filter_listings(
         self,
         filter_obj: ListingFilter,
         user_id: int
-    ) -> List[Dict]:
+    ) -> List[Listing]:
         """
         Получить и отфильтровать объявления.
         
@@ -42,62 +50,41 @@ class ListingService:
             user_id: ID пользователя
         
         Returns:
-            List[Dict]: Список новых отфильтрованных объявлений
+            List[Listing]: Список новых отфильтрованных объявлений
         """
-        all_listings: List[Dict] = []
-        
         # Получаем город из фильтра для передачи в парсеры
         city = filter_obj.filters.get('city') if hasattr(filter_obj, 'filters') else None
         
         # Парсинг со всех сайтов (всегда парсим все источники)
-        try:
-            listings = await self.onliner_parser.parse_listings(settings.onliner_url)
-            all_listings.extend(listings)
-            logger.info(f"Получено {len(listings)} объявлений с Onliner")
-        except Exception as e:
-            logger.error(f"Ошибка парсинга Onliner: {e}")
-        
-        try:
-            listings = await self.kufar_parser.parse_listings(settings.kufar_url, city=city)
-            all_listings.extend(listings)
-            logger.info(f"Получено {len(listings)} объявлений с Kufar")
-        except Exception as e:
-            logger.error(f"Ошибка парсинга Kufar: {e}")
-        
-        try:
-            listings = await self.realt_parser.parse_listings(settings.realt_url)
-            all_listings.extend(listings)
-            logger.info(f"Получено {len(listings)} объявлений с Realt.by")
-        except Exception as e:
-            logger.error(f"Ошибка парсинга Realt.by: {e}")
+        sources = [
+            ('Onliner', self.onliner_parser, settings.onliner_url, {}),
+            ('Kufar', self.kufar_parser, settings.kufar_url, {'city': city}),
+            ('Realt.by', self.realt_parser, settings.realt_url, {}),
+            ('Domovita', self.domovita_parser, settings.domovita_url, {}),
+        ]
         
-        try:
-            listings = await self.domovita_parser.parse_listings(settings.domovita_url)
-            all_listings.extend(listings)
-            logger.info(f"Получено {len(listings)} объявлений с Domovita")
-        except Exception as e:
-            logger.error(f"Ошибка парсинга Domovita: {e}")
-        
-        # Фильтрация и проверка на новые объявления
-        filtered_listings: List[Dict] = []
-        for listing in all_listings:
-            if filter_obj.matches(listing):
-                # Проверяем, новое ли это объявление
-                is_new = self.db.add_listing(
-                    listing['listing_id'],
-                    listing['source'],
-                    listing['address'],
-                    listing.get('rooms'),
-                    listing.get('price_byn', 0),
-                    listing.get('price_usd', 0),
-                    listing.get('landlord', ''),
-                    listing['url']
-                )
-                if is_new and not self.db.is_listing_sent_to_user(
-                    listing['listing_id'],
-                    user_id
-                ):
-                    filtered_listings.append(listing)
+        # Фильтрация и проверка на новые объявления по мере их получения от парсеров
+        filtered_listings: List[Listing] = []
+        for source_name, parser, url, kwargs in sources:
+            received = 0
+            listings = parser.parse_listings_iter(url, **kwargs)
+            try:
+                while True:
+                    # В try только итерация парсера: ошибки фильтра и БД не выдаются
+                    # за ошибки парсинга и, как раньше, не перехватываются здесь
+                    try:
+                        listing = await listings.__anext__()
+                    except StopAsyncIteration:
+                        logger.info(f"Получено {received} объявлений с {source_name}")
+                        break
+                    except Exception as e:
+                        logger.error(f"Ошибка парсинга {source_name}: {e}")
+                        break
+                    received += 1
+                    if self._is_new_matching(listing, filter_obj, user_id):
+                        filtered_listings.append(listing)
+            finally:
+                await listings.aclose()
         
         logger.info(
             f"Найдено {len(filtered_listings)} новых объявлений "
@@ -106,3 +93,33 @@ class ListingService:
         
         # Ограничиваем до 15 последних объявлений
         return filtered_listings[:15]
+    
+    def _is_new_matching(self, listing: Listing, filter_obj: ListingFilter, user_id: int) -> bool:
+        """
+        Проверить, подходит ли объявление под фильтр и не отправлялось ли оно пользователю.
+        
+        Args:
+            listing: Данные объявления
+            filter_obj: Объект фильтра
+            user_id: ID пользователя
+        
+        Returns:
+            bool: True если объявление новое и соответствует фильтру
+        """
+        if not filter_obj.matches(listing):
+            return False
+        # Проверяем, новое ли это объявление
+        is_new = self.db.add_listing(
+            listing['listing_id'],
+            listing['source'],
+            listing['address'],
+            listing.get('rooms'),
+            listing.get('price_byn', 0),
+            listing.get('price_usd', 0),
+            listing.get('landlord', ''),
+            listing['url']
+        )
+        return is_new and not self.db.is_listing_sent_to_user(
+            listing['listing_id'],
+            user_id
+        )
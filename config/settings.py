@@ -61,8 +61,23 @@ class Settings:
         # Таймаут для HTTP запросов
         self.http_timeout: int = int(os.getenv('HTTP_TIMEOUT', '10'))
         
+        # Максимальное количество одновременных HTTP-соединений при пакетной загрузке страниц
+        self.http_max_connections: int = int(os.getenv('HTTP_MAX_CONNECTIONS', '16'))
+        
         # Максимальное количество объявлений для парсинга за раз
         self.max_listings_per_source: int = int(os.getenv('MAX_LISTINGS_PER_SOURCE', '20'))
+        
+        # Максимальное количество одновременно разбираемых объявлений Domovita
+        # (страницы через общий Chromium всё равно загружаются по одной)
+        self.domovita_concurrency: int = int(os.getenv('DOMOVITA_CONCURRENCY', '8'))
+        
+        # Максимальное количество одновременно разбираемых объявлений Onliner
+        # (страницы через общий Chromium всё равно загружаются по одной)
+        self.onliner_concurrency: int = int(os.getenv('ONLINER_CONCURRENCY', '4'))
+        
+        # Количество окон Chromium для параллельной догрузки страниц объявлений Kufar
+        # (1 — только общий браузер; каждое дополнительное окно — отдельный процесс Chromium)
+        self.kufar_browser_pool: int = int(os.getenv('KUFAR_BROWSER_POOL', '1'))
     
     def validate(self) -> bool:
         """
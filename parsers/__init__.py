@@ -3,5 +3,6 @@ from .onliner import OnlinerParser
 from .kufar import KufarParser
 from .realt import RealtParser
 from .domovita import DomovitaParser
+from .listing import Listing
 
-__all__ = ['OnlinerParser', 'KufarParser', 'RealtParser', 'DomovitaParser']
+__all__ = ['OnlinerParser', 'KufarParser', 'RealtParser', 'DomovitaParser', 'Listing']
@@ -1,15 +1,147 @@
 """Базовый класс для парсеров объявлений."""
+import asyncio
+import hashlib
 import re
 import logging
+import threading
 from abc import ABC, abstractmethod
-from typing import List, Dict, Optional, Tuple
+from functools import lru_cache
+from typing import AsyncIterator, List, Optional, Tuple
 import aiohttp
 from bs4 import BeautifulSoup
 
+from .listing import Listing
 from config import settings
 
 logger = logging.getLogger(__name__)
 
+# Разделители разрядов, которые удаляются из найденного числа
+_NUM_STRIP = str.maketrans('', '', ' \xa0\u2009')
+
+# Кэшируются только короткие тексты (заголовки, блоки цены) — полный текст
+# страницы в кэше занимал бы слишком много памяти
+_CACHEABLE_TEXT_LEN = 1024
+
+# XML-объявление в начале страницы (<?xml version="1.0" encoding="..."?>)
+_RE_XML_DECLARATION = re.compile(r'\s*<\?xml[^>]*\?>')
+
+
+@lru_cache(maxsize=4096)
+def make_listing_id(url: str) -> str:
+    """
+    Получить стабильный идентификатор объявления по его URL.
+    
+    Хеш нужен только как ключ, а не для безопасности. Функция остаётся MD5, потому что
+    идентификаторы уже сохранены в БД (listings.listing_id, отметки об отправке):
+    смена алгоритма заново разослала бы пользователям все известные объявления.
+    Результат кэшируется по URL: при каждой проверке парсеры видят в основном те же объявления.
+    
+    Args:
+        url: Нормализованный URL объявления
+    
+    Returns:
+        str: Идентификатор объявления (32 hex-символа)
+    """
+    return hashlib.md5(url.encode()).hexdigest()
+
+
+def strip_xml_declaration(html: str) -> str:
+    """
+    Убрать XML-объявление в начале уже декодированной страницы.
+    
+    lxml не разбирает строку str с объявлением кодировки (ValueError), а BeautifulSoup
+    его пропускает — без объявления lxml разбирает такие страницы так же.
+    
+    Args:
+        html: HTML страницы
+    
+    Returns:
+        str: HTML без XML-объявления
+    """
+    match = _RE_XML_DECLARATION.match(html)
+    return html[match.end():] if match else html
+
+
+@lru_cache(maxsize=4096)
+def _extract_price(text: str) -> Tuple[Optional[float], Optional[float]]:
+    """Извлечь цены (BYN, USD) из текста; результат кэшируется по тексту."""
+    price_byn: Optional[float] = None
+    price_usd: Optional[float] = None
+    
+    # Нормализация текста - более агрессивная
+    normalized_text = text.replace(',', '').replace('\xa0', ' ').replace('\u2009', ' ').replace('\u00a0', ' ')
+    # Убираем множественные пробелы
+    normalized_text = ' '.join(normalized_text.split())
+    
+    # Поиск USD - улучшенные паттерны
+    usd_patterns = [
+        r'(\d+(?:\s?\d+)*(?:\.\d+)?)\s*\$',  # 500 $ или 500$
+        r'\$\s*(\d+(?:\s?\d+)*(?:\.\d+)?)',  # $ 500
+        r'(\d+(?:\s?\d+)*(?:\.\d+)?)\s*USD',  # 500 USD
+        r'USD\s*(\d+(?:\s?\d+)*(?:\.\d+)?)',  # USD 500
+        r'(\d+(?:\s?\d+)*(?:\.\d+)?)\s*долл',  # 500 долл
+    ]
+    for pattern in usd_patterns:
+        usd_match = re.search(pattern, normalized_text, re.IGNORECASE)
+        if usd_match:
+            try:
+                price_str = usd_match.group(1).translate(_NUM_STRIP)
+                # Цены почти всегда целые — int() быстрее разбора float; результат остаётся float
+                price_usd = float(price_str) if '.' in price_str else float(int(price_str))
+                # Проверяем разумность цены (не больше 10000 для аренды)
+                if price_usd > 0 and price_usd < 10000:
+                    break
+            except ValueError:
+                continue
+    
+    # Поиск BYN - улучшенные паттерны
+    byn_patterns = [
+        r'(\d+(?:\s?\d+)*(?:\.\d+)?)\s*(?:BYN|р\.|руб|бел\.?\s*руб)',  # 500 BYN
+        r'(\d+(?:\s?\d+)*(?:\.\d+)?)\s*р/мес',  # 500 р/мес
+        r'(\d+(?:\s?\d+)*(?:\.\d+)?)\s*руб/мес',  # 500 руб/мес
+    ]
+    for pattern in byn_patterns:
+        byn_match = re.search(pattern, normalized_text, re.IGNORECASE)
+        if byn_match:
+            try:
+                price_str = byn_match.group(1).translate(_NUM_STRIP)
+                price_byn = float(price_str) if '.' in price_str else float(int(price_str))
+                # Проверяем разумность цены (не больше 10000 для аренды)
+                if price_byn > 0 and price_byn < 10000:
+                    break
+            except ValueError:
+                continue
+    
+    return price_byn, price_usd
+
+
+@lru_cache(maxsize=4096)
+def _extract_rooms(text: str) -> Optional[int]:
+    """Извлечь количество комнат из текста; результат кэшируется по тексту."""
+    # Поиск паттернов: "1-комнатная", "2 комнаты", "3-комн" и т.д.
+    patterns = [
+        r'(\d+)[-\s]?комнатн',  # 1-комнатная, 2 комнатная
+        r'(\d+)[-\s]?комн',  # 1-комн, 2 комн
+        r'(\d+)\s*комнат',  # 1 комнат, 2 комнаты
+        r'(\d+)\s*к\.',  # 1 к., 2 к.
+        r'(\d+)\s*к\b',  # 1к, 2к (отдельное слово)
+        r'(\d+)[-\s]?к\.?\s*квартир',  # 1-к квартира, 2к квартира
+        r'(\d+)[-\s]?комнатная',  # 1-комнатная (более точный паттерн)
+    ]
+    
+    for pattern in patterns:
+        match = re.search(pattern, text.lower())
+        if match:
+            try:
+                rooms = int(match.group(1))
+                # Проверяем разумность (1-10 комнат)
+                if 1 <= rooms <= 10:
+                    return rooms
+            except ValueError:
+                continue
+    
+    return None
+
 
 class BaseParser(ABC):
     """Базовый абстрактный класс для парсеров объявлений."""
@@ -36,37 +168,74 @@ class BaseParser(ABC):
         Args:
             url: URL страницы для получения
         
+        Returns:
+            Optional[str]: HTML содержимое страницы или None при ошибке
+        """
+        async with aiohttp.ClientSession() as session:
+            return await self._fetch_with_session(session, url)
+    
+    async def fetch_many(self, urls: List[str]) -> List[Optional[str]]:
+        """
+        Получить HTML нескольких страниц параллельно через один пул соединений.
+        
+        Args:
+            urls: URL страниц
+        
+        Returns:
+            List[Optional[str]]: HTML страниц в порядке urls (None для неудачных загрузок)
+        """
+        if not urls:
+            return []
+        connector = aiohttp.TCPConnector(limit=settings.http_max_connections)
+        async with aiohttp.ClientSession(connector=connector) as session:
+            return list(await asyncio.gather(
+                *(self._fetch_with_session(session, url) for url in urls)
+            ))
+    
+    async def _fetch_with_session(self, session: aiohttp.ClientSession, url: str) -> Optional[str]:
+        """
+        Получить HTML страницы через уже открытую сессию.
+        
+        Args:
+            session: Сессия aiohttp
+            url: URL страницы для получения
+        
         Returns:
             Optional[str]: HTML содержимое страницы или None при ошибке
         """
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    url,
-                    headers=self.headers,
-                    timeout=self.timeout
-                ) as response:
-                    if response.status == 200:
-                        return await response.text()
-                    else:
-                        logger.warning(f"HTTP {response.status} для {url}")
+            async with session.get(
+                url,
+                headers=self.headers,
+                timeout=self.timeout
+            ) as response:
+                if response.status == 200:
+                    return await response.text()
+                else:
+                    logger.warning(f"HTTP {response.status} для {url}")
         except aiohttp.ClientError as e:
             logger.error(f"Ошибка при получении страницы {url}: {e}")
         except Exception as e:
             logger.error(f"Неожиданная ошибка при получении {url}: {e}")
         return None
     
-    async def fetch_page_prefer_browser(self, url: str, wait_time: int = 8) -> Optional[str]:
+    async def fetch_page_prefer_browser(
+        self,
+        url: str,
+        wait_time: int = 8,
+        cancelled: Optional[threading.Event] = None
+    ) -> Optional[str]:
         """
         Загрузить страницу: через Chromium, если передан selenium_parser, иначе через aiohttp.
         Использование браузера снижает количество блокировок.
+        Установленное событие cancelled отменяет ещё не начатую загрузку через Chromium.
         """
         if self.selenium_parser:
-            return await self.selenium_parser.fetch_page_selenium(url, wait_time=wait_time)
+            return await self.selenium_parser.fetch_page_selenium(url, wait_time=wait_time, cancelled=cancelled)
         return await self.fetch_page(url)
     
     @abstractmethod
-    async def parse_listings(self, url: str) -> List[Dict]:
+    async def parse_listings(self, url: str) -> List[Listing]:
         """
         Парсинг объявлений с сайта.
         
@@ -74,10 +243,27 @@ class BaseParser(ABC):
             url: URL для парсинга
         
         Returns:
-            List[Dict]: Список объявлений
+            List[Listing]: Список объявлений
         """
         pass
     
+    async def parse_listings_iter(self, url: str, **kwargs) -> AsyncIterator[Listing]:
+        """
+        Потоковый парсинг объявлений: выдаёт объявления по одному.
+        
+        По умолчанию оборачивает parse_listings. Парсеры могут переопределить метод,
+        чтобы отдавать объявления по мере извлечения, не дожидаясь обхода всей страницы.
+        
+        Args:
+            url: URL для парсинга
+            **kwargs: Дополнительные параметры parse_listings (например, city)
+        
+        Yields:
+            Listing: Данные объявления
+        """
+        for listing in await self.parse_listings(url, **kwargs):
+            yield listing
+    
     def extract_price(self, text: str) -> Tuple[Optional[float], Optional[float]]:
         """
         Извлечь цены в BYN и USD из текста.
@@ -88,53 +274,9 @@ class BaseParser(ABC):
         Returns:
             Tuple[Optional[float], Optional[float]]: (цена_BYN, цена_USD)
         """
-        price_byn: Optional[float] = None
-        price_usd: Optional[float] = None
-        
-        # Нормализация текста - более агрессивная
-        normalized_text = text.replace(',', '').replace('\xa0', ' ').replace('\u2009', ' ').replace('\u00a0', ' ')
-        # Убираем множественные пробелы
-        normalized_text = ' '.join(normalized_text.split())
-        
-        # Поиск USD - улучшенные паттерны
-        usd_patterns = [
-            r'(\d+(?:\s?\d+)*(?:\.\d+)?)\s*\$',  # 500 $ или 500$
-            r'\$\s*(\d+(?:\s?\d+)*(?:\.\d+)?)',  # $ 500
-            r'(\d+(?:\s?\d+)*(?:\.\d+)?)\s*USD',  # 500 USD
-            r'USD\s*(\d+(?:\s?\d+)*(?:\.\d+)?)',  # USD 500
-            r'(\d+(?:\s?\d+)*(?:\.\d+)?)\s*долл',  # 500 долл
-        ]
-        for pattern in usd_patterns:
-            usd_match = re.search(pattern, normalized_text, re.IGNORECASE)
-            if usd_match:
-                try:
-                    price_str = usd_match.group(1).replace(' ', '').replace('\xa0', '')
-                    price_usd = float(price_str)
-                    # Проверяем разумность цены (не больше 10000 для аренды)
-                    if price_usd > 0 and price_usd < 10000:
-                        break
-                except ValueError:
-                    continue
-        
-        # Поиск BYN - улучшенные паттерны
-        byn_patterns = [
-            r'(\d+(?:\s?\d+)*(?:\.\d+)?)\s*(?:BYN|р\.|руб|бел\.?\s*руб)',  # 500 BYN
-            r'(\d+(?:\s?\d+)*(?:\.\d+)?)\s*р/мес',  # 500 р/мес
-            r'(\d+(?:\s?\d+)*(?:\.\d+)?)\s*руб/мес',  # 500 руб/мес
-        ]
-        for pattern in byn_patterns:
-            byn_match = re.search(pattern, normalized_text, re.IGNORECASE)
-            if byn_match:
-                try:
-                    price_str = byn_match.group(1).replace(' ', '').replace('\xa0', '')
-                    price_byn = float(price_str)
-                    # Проверяем разумность цены (не больше 10000 для аренды)
-                    if price_byn > 0 and price_byn < 10000:
-                        break
-                except ValueError:
-                    continue
-        
-        return price_byn, price_usd
+        if len(text) > _CACHEABLE_TEXT_LEN:
+            return _extract_price.__wrapped__(text)
+        return _extract_price(text)
     
     def extract_rooms(self, text: str) -> Optional[int]:
         """
@@ -146,26 +288,6 @@ class BaseParser(ABC):
         Returns:
             Optional[int]: Количество комнат или None
         """
-        # Поиск паттернов: "1-комнатная", "2 комнаты", "3-комн" и т.д.
-        patterns = [
-            r'(\d+)[-\s]?комнатн',  # 1-комнатная, 2 комнатная
-            r'(\d+)[-\s]?комн',  # 1-комн, 2 комн
-            r'(\d+)\s*комнат',  # 1 комнат, 2 комнаты
-            r'(\d+)\s*к\.',  # 1 к., 2 к.
-            r'(\d+)\s*к\b',  # 1к, 2к (отдельное слово)
-            r'(\d+)[-\s]?к\.?\s*квартир',  # 1-к квартира, 2к квартира
-            r'(\d+)[-\s]?комнатная',  # 1-комнатная (более точный паттерн)
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, text.lower())
-            if match:
-                try:
-                    rooms = int(match.group(1))
-                    # Проверяем разумность (1-10 комнат)
-                    if 1 <= rooms <= 10:
-                        return rooms
-                except ValueError:
-                    continue
-        
-        return None
+        if len(text) > _CACHEABLE_TEXT_LEN:
+            return _extract_rooms.__wrapped__(text)
+        return _extract_rooms(text)
@@ -1,24 +1,108 @@
 """Парсер для Domovita.by."""
+import asyncio
 import re
-import hashlib
 import json
 import logging
-from typing import List, Dict, Optional
-from bs4 import BeautifulSoup
+import threading
+from collections import OrderedDict
+from typing import List, Dict, Optional, Set, Tuple
+from bs4 import BeautifulSoup, SoupStrainer
 
-from .base import BaseParser
+from .base import BaseParser, make_listing_id
+from .listing import Listing
 from config import settings
 
 logger = logging.getLogger(__name__)
 
+_SITE_PREFIX = 'https://domovita.by/'
+# Запас окна загрузок сверх недостающих объявлений (часть ссылок не даёт объявления)
+_HARVEST_SLACK = 2
+
+# Шаблоны компилируются один раз при импорте модуля
+_RE_OBJECT_ITEM = re.compile(r'object-item')
+_RE_LISTING_HREF = re.compile(r'/minsk/flats/rent/|/object/|/flats/rent/|/flats-for-day/rent/')
+_RE_FALLBACK_HREF = re.compile(r'/minsk/flats/rent/|/object/|/flats/rent/')
+# Ссылки на конкретные объявления: отбор и исключение категорий за один проход регулярки
+_RE_VALID_LISTING = re.compile(
+    r'^(?!.*(?:/1-room-flats/|/2-room-flats/|/3-room-flats/|/sale|/create|/edit))'
+    r'(?=.*(?:/minsk/flats/rent/|/object/|/flats/rent/|/flats-for-day/rent/))'
+)
+_RE_VALID_FALLBACK_LISTING = re.compile(
+    r'^(?!.*(?:/create|/edit))(?=.*(?:/minsk/flats/rent/|/object/|/flats/rent/))'
+)
+_RE_WIDE_HREF = re.compile(r'/flats/rent/|/object/')
+_RE_CLASS_FALLBACK = re.compile(r'listing|offer|ad|item|card')
+_RE_CLASS_ADDRESS = re.compile(r'object-item__address|address')
+_RE_CLASS_PRICE = re.compile(r'object-item__price|price')
+# CSS-селекторы блоков страницы объявления (подстрока в атрибуте class)
+_SEL_LANDLORD_BLOCKS = (
+    'div[class*="owner"], div[class*="landlord"], div[class*="agent"], div[class*="status"], '
+    'span[class*="owner"], span[class*="landlord"], span[class*="agent"], span[class*="status"]'
+)
+_SEL_ADDRESS_BLOCKS = (
+    'div[class*="address"], div[class*="location"], div[class*="place"], div[class*="object-info"], '
+    'span[class*="address"], span[class*="location"], span[class*="place"], span[class*="object-info"]'
+)
+# Классы блоков страницы объявления, которые реально читаются при разборе
+_RE_DETAIL_CLASS = re.compile(
+    r'owner|landlord|agent|status|address|location|place|object-info|'
+    r'calculator__price|dropdown-pricechange|description'
+)
+
+
+def _is_detail_block(name: str, attrs: Dict) -> bool:
+    """
+    Отобрать теги страницы объявления, которые нужны парсеру.
+    
+    Args:
+        name: Имя тега
+        attrs: Атрибуты тега
+        
+    Returns:
+        bool: True, если тег нужно сохранить в дереве
+    """
+    if name == 'title':
+        return True
+    if name not in ('div', 'span'):
+        return False
+    classes = attrs.get('class') or ''
+    if not isinstance(classes, str):
+        classes = ' '.join(classes)
+    return bool(_RE_DETAIL_CLASS.search(classes))
+
+
+# lxml строит дерево только из нужных блоков, остальная разметка страницы отбрасывается
+_DETAIL_STRAINER = SoupStrainer(_is_detail_block)
+# Теги, которые считаются карточкой объявления при подъёме от ссылки
+_CARD_TAGS = frozenset(('div', 'article', 'li'))
+_RE_ROOMS_URL = re.compile(r'/(\d+)-komnatnaa', re.IGNORECASE)
+_RE_ROOM_FLATS = re.compile(r'/(\d+)-room-flats/')
+_ADDRESS_PATTERNS = (
+    re.compile(r'Минск[,\s]+(?:ул\.|улица|пр\.|проспект|пер\.|переулок|бул\.|бульвар)?\s*([А-Яа-я\s\d,.-]+)', re.IGNORECASE),
+    re.compile(r'Минск[,\s]+([А-Яа-я\s\d,.-]{3,})', re.IGNORECASE),
+    re.compile(r'г\.?\s*Минск[,\s]+([А-Яа-я\s\d,.-]+)', re.IGNORECASE),
+)
+_RE_MINSK_ADDR = re.compile(r'минск[,\s]+([а-яё\s\d,.-]{5,50})')
+# Обозначения валют, без которых extract_price заведомо ничего не найдёт
+_RE_PRICE_MARKER = re.compile(r'\$|usd|долл|byn|р\.|руб|р/мес', re.IGNORECASE)
+# Признаки объявления от собственника: одна регулярка вместо поиска каждого слова
+# ("от собственника", "напрямую от собственника", "от хозяина" покрываются более короткими)
+_RE_OWNER = re.compile(r'собственник|без посредников|хозяин|владелец|напрямую|без агентств', re.IGNORECASE)
+# Признак агентства ("агентство" покрывается префиксом)
+_RE_AGENT = re.compile(r'агент', re.IGNORECASE)
+
 
 class DomovitaParser(BaseParser):
     """Парсер для Domovita.by (загрузка через Chromium при передаче selenium_parser)."""
     
     def __init__(self, selenium_parser=None):
         super().__init__(selenium_parser=selenium_parser)
+        # Загруженные за один проход страницы объявлений (URL -> HTML)
+        self._fetch_cache: 'OrderedDict[str, str]' = OrderedDict()
+        # Карточка-предок для непосредственного родителя ссылки (id(родитель) -> карточка)
+        self._parent_cache: Dict[int, object] = {}
     
-    async def parse_listings(self, url: str) -> List[Dict]:
+    async def parse_listings(self, url: str) -> List[Listing]:
         """
         Парсинг объявлений с Domovita.by.
         
@@ -26,188 +110,278 @@ class DomovitaParser(BaseParser):
             url: URL страницы Domovita.by
         
         Returns:
-            List[Dict]: Список объявлений
+            List[Listing]: Список объявлений
         """
+        self._fetch_cache.clear()
         html = await self.fetch_page_prefer_browser(url, wait_time=10)
         if not html:
             return []
         
-        soup = BeautifulSoup(html, 'lxml')
-        listings = []
-        
-        # Поиск объявлений на странице - Domovita использует класс "object-item"
-        listing_containers = soup.find_all('div', class_=re.compile(r'object-item'))
-        
-        # Если не найдено, ищем по ссылкам на конкретные объявления
-        if not listing_containers:
-            # Ищем ссылки на конкретные объявления (исключаем категории)
-            links = soup.find_all('a', href=re.compile(r'/minsk/flats/rent/|/object/|/flats/rent/|/flats-for-day/rent/'))
-            # Фильтруем - исключаем категории и общие страницы
-            valid_links = [
-                link for link in links
-                if link.get('href') and
-                link.get('href') != url and
-                '/1-room-flats/' not in link.get('href', '') and
-                '/2-room-flats/' not in link.get('href', '') and
-                '/3-room-flats/' not in link.get('href', '') and
-                '/sale' not in link.get('href', '') and
-                len(link.get('href', '').split('/')) > 5  # Конкретное объявление имеет больше сегментов в URL
-            ]
-            seen_urls = set()
-            for link in valid_links[:settings.max_listings_per_source]:
-                href = link.get('href', '')
-                if href:
-                    if not href.startswith('http'):
-                        href = href.lstrip('/')
-                        href = 'https://domovita.by/' + href
-                    if '?' in href:
-                        href = href.split('?')[0]
-                    if '#' in href:
-                        href = href.split('#')[0]
-                    # Пропускаем дубликаты
-                    if href in seen_urls:
-                        continue
-                    seen_urls.add(href)
-                try:
-                    listing_data = await self._parse_listing_from_link(link, url)
-                    if listing_data:
-                        # Проверяем дубликаты по URL
-                        if listing_data['url'] not in [l['url'] for l in listings]:
-                            listings.append(listing_data)
-                except Exception as e:
-                    logger.warning(f"Ошибка при парсинге объявления Domovita: {e}")
+        try:
+            soup = BeautifulSoup(html, 'lxml')
+            max_listings = settings.max_listings_per_source
+            
+            # Стратегии поиска в порядке приоритета: (поиск узлов, узлы — ссылки на объявления).
+            # Используется первая стратегия, давшая хотя бы одно объявление.
+            # limit останавливает обход документа, как только найдено нужное количество узлов.
+            strategies = (
+                # Domovita использует класс "object-item"
+                (lambda: soup.find_all('div', class_=_RE_OBJECT_ITEM, limit=max_listings), False),
+                # Ссылки на конкретные объявления (исключаем категории; у объявления больше сегментов в URL)
+                (lambda: self._find_listing_links(soup, url, _RE_VALID_LISTING, min_slashes=5, limit=max_listings), True),
+                # Поиск по другим классам
+                (lambda: soup.find_all(['div', 'article'], class_=_RE_CLASS_FALLBACK, limit=max_listings), False),
+                # Поиск по структуре
+                (lambda: soup.find_all('div', attrs={'data-id': True}, limit=max_listings), False),
+                # Ссылки на объявления без служебных (/create, /edit)
+                (lambda: self._find_listing_links(soup, url, _RE_VALID_FALLBACK_LISTING, limit=max_listings), True),
+                # Более широкий поиск: перебираем все ссылки, пока не наберём нужное количество
+                (lambda: self._find_listing_links(soup, url, _RE_WIDE_HREF), True),
+            )
+            for find_nodes, from_links in strategies:
+                nodes = find_nodes()
+                if not nodes:
                     continue
+                listings = await self._harvest(nodes, from_links, url)
+                if listings:
+                    return listings
+            
+            return []
+        finally:
+            # Кэш держит узлы дерева страницы, отпускаем их вместе с soup
+            self._parent_cache.clear()
+    
+    async def _harvest(self, nodes: List, from_links: bool, base_url: str) -> List[Listing]:
+        """
+        Разобрать найденные узлы в объявления без дубликатов.
         
-        # Если нашли контейнеры, парсим их
-        if listing_containers:
-            for container in listing_containers[:settings.max_listings_per_source]:
-                listing_data = self._parse_listing_from_container(container, url)
-                if listing_data:
-                    listings.append(listing_data)
+        Args:
+            nodes: Контейнеры объявлений или ссылки на объявления
+            from_links: True, если nodes — ссылки (разбираются через страницу объявления)
+            base_url: URL страницы со списком
         
-        # Если все еще не найдено, ищем по другим классам
-        if not listing_containers and not listings:
-            listing_containers = soup.find_all(
-                ['div', 'article'],
-                class_=re.compile(r'listing|offer|ad|item|card')
-            )
+        Returns:
+            List[Listing]: Список объявлений (не больше max_listings_per_source)
+        """
+        listings: List[Listing] = []
+        seen_urls: Set[str] = set()  # URL уже добавленных (или поставленных в очередь) объявлений
+        max_listings = settings.max_listings_per_source
         
-        # Если не найдено по классам, ищем по структуре
-        if not listing_containers and not listings:
-            listing_containers = soup.find_all('div', attrs={'data-id': True})
-        
-        # Альтернативный подход - поиск по ссылкам на объявления
-        if not listing_containers and not listings:
-            # Ищем ссылки на объявления (обычно содержат /minsk/flats/rent/ или /object/)
-            links = soup.find_all('a', href=re.compile(r'/minsk/flats/rent/|/object/|/flats/rent/'))
-            # Фильтруем служебные ссылки
-            valid_links = [
-                link for link in links 
-                if link.get('href') and 
-                '/create' not in link.get('href', '') and
-                '/edit' not in link.get('href', '') and
-                link.get('href') != url
-            ]
-            seen_urls = set()
-            for link in valid_links[:settings.max_listings_per_source]:
-                href = link.get('href', '')
-                if href:
-                    if not href.startswith('http'):
-                        href = href.lstrip('/')
-                        href = 'https://domovita.by/' + href
-                    if '?' in href:
-                        href = href.split('?')[0]
-                    if '#' in href:
-                        href = href.split('#')[0]
-                    # Пропускаем дубликаты
-                    if href in seen_urls:
-                        continue
-                    seen_urls.add(href)
-                try:
-                    listing_data = await self._parse_listing_from_link(link, url)
-                    if listing_data:
-                        # Проверяем дубликаты по URL
-                        if listing_data['url'] not in [l['url'] for l in listings]:
-                            listings.append(listing_data)
-                except Exception as e:
-                    logger.warning(f"Ошибка при парсинге объявления Domovita: {e}")
-                    continue
-        else:
-            for container in listing_containers[:settings.max_listings_per_source]:
-                listing_data = self._parse_listing_from_container(container, url)
-                if listing_data:
+        if not from_links:
+            for container in nodes:
+                listing_data = self._parse_listing_from_container(container, base_url)
+                # Проверяем дубликаты по URL
+                if listing_data and listing_data.url not in seen_urls:
+                    seen_urls.add(listing_data.url)
                     listings.append(listing_data)
+                    if len(listings) >= max_listings:
+                        break
+            return listings
         
-        # Если все еще нет объявлений, пробуем более широкий поиск
-        if not listings:
-            all_links = soup.find_all('a', href=True)
-            for link in all_links:
-                href = link.get('href', '')
-                # Ищем ссылки на конкретные объявления
-                if ('/flats/rent/' in href or '/object/' in href) and href != url:
-                    # Нормализуем URL
-                    if not href.startswith('http'):
-                        href = href.lstrip('/')
-                        href = 'https://domovita.by/' + href
-                    if '?' in href:
-                        href = href.split('?')[0]
-                    if '#' in href:
-                        href = href.split('#')[0]
-                    # Проверяем дубликаты
-                    if href in [l['url'] for l in listings]:
-                        continue
+        # Пропускаем дубликаты ссылок до загрузки страниц объявлений. URL объявления —
+        # это нормализованный href, поэтому тот же набор seen_urls отсекает и дубликаты результатов.
+        candidates = []
+        for link in nodes:
+            href = link.get('href', '')
+            if not href:
+                continue
+            href = self._normalize_href(href)
+            if href in seen_urls:
+                continue
+            seen_urls.add(href)
+            candidates.append(link)
+        
+        # Объявления разбираются параллельно, не больше domovita_concurrency одновременно
+        # (страницы через общий Chromium всё равно загружаются по очереди)
+        semaphore = asyncio.BoundedSemaphore(settings.domovita_concurrency)
+        
+        # Отмена задач не останавливает загрузку, уже переданную в пул потоков, поэтому
+        # загрузки через Chromium проверяют это событие перед переходом
+        stop = threading.Event()
+        
+        async def parse_link(index: int, link) -> Tuple[int, Optional[Listing]]:
+            async with semaphore:
+                return index, await self._parse_listing_from_link(link, base_url, cancelled=stop)
+        
+        # Запускаем окно по числу недостающих объявлений с небольшим запасом и забираем результаты
+        # по мере готовности; как только набрано нужное количество, остальное отменяем
+        found: List[Tuple[int, Listing]] = []
+        tasks: List[asyncio.Future] = []
+        start = 0
+        try:
+            while start < len(candidates) and len(found) < max_listings:
+                window = candidates[start:start + max_listings - len(found) + _HARVEST_SLACK]
+                tasks = [
+                    asyncio.ensure_future(parse_link(start + offset, link))
+                    for offset, link in enumerate(window)
+                ]
+                start += len(window)
+                for next_done in asyncio.as_completed(tasks):
                     try:
-                        listing_data = await self._parse_listing_from_link(link, url)
-                        if listing_data and listing_data['url'] not in [l['url'] for l in listings]:
-                            listings.append(listing_data)
-                            if len(listings) >= settings.max_listings_per_source:
-                                break
+                        index, listing_data = await next_done
                     except Exception as e:
                         logger.warning(f"Ошибка при парсинге объявления Domovita: {e}")
                         continue
+                    if listing_data:
+                        found.append((index, listing_data))
+                        if len(found) >= max_listings:
+                            break
+        finally:
+            stop.set()
+            for task in tasks:
+                task.cancel()
         
+        # Возвращаем объявления в порядке страницы, а не в порядке загрузки
+        found.sort(key=lambda item: item[0])
+        listings.extend(listing_data for _, listing_data in found)
         return listings
     
+    async def _fetch_listing_page(
+        self,
+        href: str,
+        cancelled: Optional[threading.Event] = None
+    ) -> Optional[str]:
+        """
+        Загрузить страницу объявления, повторно используя уже загруженные за проход.
+        
+        Args:
+            href: Нормализованный URL объявления
+            cancelled: Событие отмены ещё не начатой загрузки через Chromium
+        
+        Returns:
+            Optional[str]: HTML страницы или None при ошибке
+        """
+        html = self._fetch_cache.get(href)
+        if html is not None:
+            self._fetch_cache.move_to_end(href)
+            return html
+        html = await self.fetch_page_prefer_browser(href, wait_time=8, cancelled=cancelled)
+        if html:
+            self._fetch_cache[href] = html
+            if len(self._fetch_cache) > settings.max_listings_per_source * 2:
+                self._fetch_cache.popitem(last=False)
+        return html
+    
+    @staticmethod
+    def _normalize_href(href: str) -> str:
+        """
+        Привести ссылку к абсолютному URL без параметров и якоря.
+        
+        Args:
+            href: Ссылка из атрибута href
+        
+        Returns:
+            str: Нормализованный URL
+        """
+        if not href.startswith('http'):
+            href = _SITE_PREFIX + href.lstrip('/')
+        return href.partition('?')[0].partition('#')[0]
+    
+    def _find_card_parent(self, element):
+        """
+        Найти ближайший div/article/li-предок элемента.
+        
+        Соседние ссылки одной карточки имеют общего родителя, поэтому результат
+        кэшируется по нему и подъём по дереву выполняется один раз на карточку.
+        
+        Args:
+            element: Элемент BeautifulSoup
+        
+        Returns:
+            Элемент-карточка или None
+        """
+        start = element.parent
+        if start is None:
+            return None
+        key = id(start)
+        if key in self._parent_cache:
+            return self._parent_cache[key]
+        
+        parent = start
+        while parent is not None and parent.name not in _CARD_TAGS:
+            parent = parent.parent
+        self._parent_cache[key] = parent
+        return parent
+    
+    @staticmethod
+    def _find_listing_links(
+        soup,
+        url: str,
+        pattern,
+        min_slashes: int = 0,
+        limit: Optional[int] = None
+    ) -> List:
+        """
+        Найти ссылки на объявления, href которых проходит шаблон.
+        
+        Args:
+            soup: Объект BeautifulSoup страницы
+            url: URL самой страницы (ссылки на неё пропускаются)
+            pattern: Скомпилированный шаблон допустимого href
+            min_slashes: Минимальное количество "/" в href
+            limit: Максимальное количество ссылок (обход документа останавливается на нём)
+        
+        Returns:
+            List: Подходящие элементы ссылок
+        """
+        def is_listing_href(href: Optional[str]) -> bool:
+            return (
+                href is not None
+                and href != url
+                and href.count('/') >= min_slashes
+                and pattern.search(href) is not None
+            )
+        
+        # Все проверки внутри фильтра find_all, чтобы limit считал только подходящие ссылки
+        return soup.find_all('a', href=is_listing_href, limit=limit)
+    
     async def _parse_listing_from_link(
         self,
         link_element,
-        base_url: str
-    ) -> Optional[Dict]:
+        base_url: str,
+        cancelled: Optional[threading.Event] = None
+    ) -> Optional[Listing]:
         """
         Парсинг объявления из ссылки.
         
         Args:
             link_element: Элемент ссылки BeautifulSoup
             base_url: Базовый URL
+            cancelled: Событие отмены ещё не начатой загрузки страницы объявления
         
         Returns:
-            Optional[Dict]: Данные объявления или None
+            Optional[Listing]: Данные объявления или None
         """
         try:
             href = link_element.get('href', '')
-            if href:
-                if not href.startswith('http'):
-                    href = href.lstrip('/')
-                    href = 'https://domovita.by/' + href
-                # Убираем лишние параметры
-                if '?' in href:
-                    href = href.split('?')[0]
-                if '#' in href:
-                    href = href.split('#')[0]
-            else:
+            if not href:
                 return None
+            href = self._normalize_href(href)
+            
+            # Сначала берём данные из карточки в списке: если их хватает,
+            # страницу объявления (загрузка через Chromium) не открываем
+            card = self._parse_link_card(link_element, href)
+            if card is not None:
+                card_data, complete = card
+                if complete:
+                    return self._build_listing(href, **card_data)
             
             # Загружаем страницу объявления через Chromium (меньше блокировок)
             try:
-                listing_html = await self.fetch_page_prefer_browser(href, wait_time=8)
+                listing_html = await self._fetch_listing_page(href, cancelled)
             except Exception as e:
                 logger.warning(f"Не удалось загрузить страницу объявления Domovita {href}: {e}")
                 listing_html = None
             
             if listing_html:
-                listing_soup = BeautifulSoup(listing_html, 'lxml')
+                listing_soup = BeautifulSoup(listing_html, 'lxml', parse_only=_DETAIL_STRAINER)
+                # Текст только отобранных блоков (описание, параметры, владелец), без меню и подвала
                 text = listing_soup.get_text(' ', strip=True)
                 
+                rooms = None
+                address = None
+                price_byn, price_usd = None, None
+                
                 # Извлекаем данные из title (Domovita использует title для основных данных)
                 title_elem = listing_soup.find('title')
                 if title_elem:
@@ -215,11 +389,11 @@ class DomovitaParser(BaseParser):
                     # Из title: "Сдается 1-комнатная квартира на пр-т Газеты Правда, д. 44, Минск, Московский район, 450USD"
                     rooms = self.extract_rooms(title_text)
                     address = self._extract_address(title_text, listing_soup)
-                    price_byn, price_usd = self.extract_price(title_text)
+                    price_byn, price_usd = self._extract_marked_price(title_text)
                 
                 # Извлекаем цену из calculator__price-main (USD)
                 if not price_usd:
-                    price_usd_elems = listing_soup.find_all('div', class_='calculator__price-main')
+                    price_usd_elems = listing_soup.select('div.calculator__price-main')
                     for price_elem in price_usd_elems:
                         price_text = price_elem.get_text(' ', strip=True)
                         if '$' in price_text or 'USD' in price_text:
@@ -229,30 +403,30 @@ class DomovitaParser(BaseParser):
                 
                 # Извлекаем цену BYN из dropdown-pricechange_price-block
                 if not price_byn:
-                    price_byn_elem = listing_soup.find('div', class_='dropdown-pricechange_price-block')
+                    price_byn_elem = listing_soup.select_one('div.dropdown-pricechange_price-block')
                     if price_byn_elem:
                         price_byn_text = price_byn_elem.get_text(' ', strip=True)
-                        price_byn, _ = self.extract_price(price_byn_text)
+                        price_byn, _ = self._extract_marked_price(price_byn_text)
                 
                 # Извлекаем арендодателя из owner-info__status
                 landlord = None
-                landlord_elem = listing_soup.find('div', class_='owner-info__status')
+                landlord_elem = listing_soup.select_one('div.owner-info__status')
                 if landlord_elem:
                     landlord_text = landlord_elem.get_text(' ', strip=True)
-                    if 'собственник' in landlord_text.lower() or 'от собственника' in landlord_text.lower():
+                    if _RE_OWNER.search(landlord_text):
                         landlord = "Собственник"
-                    elif 'агент' in landlord_text.lower() or 'агентство' in landlord_text.lower():
+                    elif _RE_AGENT.search(landlord_text):
                         landlord = "Агентство"
                 
                 # Если не нашли, ищем в других местах
                 if not landlord:
-                    landlord_elems = listing_soup.find_all(['div', 'span'], class_=re.compile(r'owner|landlord|agent|status'))
+                    landlord_elems = listing_soup.select(_SEL_LANDLORD_BLOCKS)
                     for landlord_elem in landlord_elems:
                         landlord_text = landlord_elem.get_text(' ', strip=True)
-                        if 'собственник' in landlord_text.lower() or 'от собственника' in landlord_text.lower():
+                        if _RE_OWNER.search(landlord_text):
                             landlord = "Собственник"
                             break
-                        elif 'агент' in landlord_text.lower() or 'агентство' in landlord_text.lower():
+                        elif _RE_AGENT.search(landlord_text):
                             landlord = "Агентство"
                             break
                 
@@ -264,26 +438,38 @@ class DomovitaParser(BaseParser):
                 if not landlord:
                     landlord = "Собственник"
                 
-                # Извлекаем комнаты из object-info__parametr
-                if rooms is None:
-                    rooms_elems = listing_soup.find_all('div', class_='object-info__parametr')
-                    for room_elem in rooms_elems:
-                        room_label = room_elem.find('span')
-                        if room_label and 'Комнат' in room_label.get_text(' ', strip=True):
-                            room_value = room_elem.find('span', class_=lambda x: x != 'object-info__parametr')
+                # Комнаты и адрес из object-info__parametr: один проход по параметрам
+                need_rooms = rooms is None
+                need_address = not address or address == 'Минск'
+                if need_rooms or need_address:
+                    for param_elem in listing_soup.select('div.object-info__parametr'):
+                        param_label = param_elem.find('span')
+                        if not param_label:
+                            continue
+                        label_text = param_label.get_text(' ', strip=True)
+                        if need_rooms and 'Комнат' in label_text:
+                            room_value = param_elem.find('span', class_=lambda x: x != 'object-info__parametr')
                             if room_value:
                                 room_text = room_value.get_text(' ', strip=True)
                                 try:
                                     rooms = int(room_text)
                                 except ValueError:
                                     rooms = self.extract_rooms(room_text)
-                            if rooms is not None:
-                                break
+                            need_rooms = rooms is None
+                        elif need_address and 'Адрес' in label_text:
+                            addr_value = param_elem.find('span', class_=lambda x: x != 'object-info__parametr')
+                            if addr_value:
+                                address = addr_value.get_text(' ', strip=True)
+                                if not address.startswith('Минск'):
+                                    address = f"Минск, {address}"
+                            need_address = False
+                        if not need_rooms and not need_address:
+                            break
                 
                 # Если не нашли комнаты, пробуем извлечь из URL
                 if rooms is None:
                     # URL обычно содержит паттерн типа "2-komnatnaa-kvartira" или "1-komnatnaa"
-                    url_match = re.search(r'/(\d+)-komnatnaa', href, re.IGNORECASE)
+                    url_match = _RE_ROOMS_URL.search(href)
                     if url_match:
                         try:
                             rooms = int(url_match.group(1))
@@ -294,23 +480,10 @@ class DomovitaParser(BaseParser):
                 if rooms is None:
                     rooms = self.extract_rooms(text)
                 
-                # Извлекаем адрес из object-info__parametr
-                if not address or address == 'Минск':
-                    address_elems = listing_soup.find_all('div', class_='object-info__parametr')
-                    for addr_elem in address_elems:
-                        addr_label = addr_elem.find('span')
-                        if addr_label and 'Адрес' in addr_label.get_text(' ', strip=True):
-                            addr_value = addr_elem.find('span', class_=lambda x: x != 'object-info__parametr')
-                            if addr_value:
-                                address = addr_value.get_text(' ', strip=True)
-                                if not address.startswith('Минск'):
-                                    address = f"Минск, {address}"
-                            break
-                
                 # Если не нашли адрес, пробуем извлечь из других элементов
                 if not address or address == 'Минск' or address == 'Адрес не указан':
                     # Ищем в других местах
-                    address_elems = listing_soup.find_all(['div', 'span'], class_=re.compile(r'address|location|place|object-info'))
+                    address_elems = listing_soup.select(_SEL_ADDRESS_BLOCKS)
                     for addr_elem in address_elems:
                         addr_text = addr_elem.get_text(' ', strip=True)
                         if 'минск' in addr_text.lower() and len(addr_text) > 10 and 'юридический' not in addr_text.lower():
@@ -322,57 +495,112 @@ class DomovitaParser(BaseParser):
                 if not address or address == 'Минск' or address == 'Адрес не указан':
                     if title_elem:
                         address = self._extract_address(title_text, listing_soup)
+            elif card is not None:
+                # Если не удалось загрузить, используем данные из карточки
+                card_data, _ = card
+                address = card_data['address']
+                rooms = card_data['rooms']
+                price_byn, price_usd = card_data['price_byn'], card_data['price_usd']
+                landlord = card_data['landlord']
             else:
-                # Если не удалось загрузить, используем данные из ссылки
-                parent = link_element.find_parent(['div', 'article', 'li'])
-                if not parent:
-                    return None
-                
-                text = parent.get_text(' ', strip=True)
-                
-                address = self._extract_address(text, parent)
-                
-                # Пробуем извлечь комнаты из URL
-                rooms = None
-                if href:
-                    room_match = re.search(r'/(\d+)-komnatnaa', href, re.IGNORECASE)
-                    if room_match:
-                        try:
-                            rooms = int(room_match.group(1))
-                        except ValueError:
-                            pass
-                
-                if rooms is None:
-                    rooms = self.extract_rooms(text) or self.extract_rooms(str(parent))
-                
-                price_byn, price_usd = self.extract_price(text)
-                
-                landlord = self._extract_landlord(text)
-                # По умолчанию - большинство объявлений от собственников
-                if not landlord:
-                    landlord = "Собственник"
-            
-            listing_id = hashlib.md5(href.encode()).hexdigest()
+                return None
             
-            return {
-                'listing_id': listing_id,
-                'source': 'Domovita',
-                'address': address or 'Адрес не указан',
-                'rooms': rooms,
-                'price_byn': price_byn,
-                'price_usd': price_usd,
-                'landlord': landlord,
-                'url': href
-            }
+            return self._build_listing(href, address, rooms, price_byn, price_usd, landlord)
         except Exception as e:
             logger.error(f"Ошибка парсинга объявления Domovita: {e}")
             return None
     
+    def _parse_link_card(self, link_element, href: str) -> Optional[Tuple[Dict, bool]]:
+        """
+        Извлечь данные объявления из карточки вокруг ссылки на странице списка.
+        
+        Args:
+            link_element: Элемент ссылки BeautifulSoup
+            href: Нормализованный URL объявления
+        
+        Returns:
+            Optional[Tuple[Dict, bool]]: (данные карточки, хватает ли их без загрузки
+            страницы объявления) или None, если карточка не найдена
+        """
+        parent = self._find_card_parent(link_element)
+        if not parent:
+            return None
+        
+        text = parent.get_text(' ', strip=True)
+        text_lower = text.lower()
+        
+        address = self._extract_address(text, parent, text_lower)
+        
+        # Пробуем извлечь комнаты из URL
+        rooms = None
+        room_match = _RE_ROOMS_URL.search(href)
+        if room_match:
+            try:
+                rooms = int(room_match.group(1))
+            except ValueError:
+                pass
+        
+        if rooms is None:
+            rooms = self.extract_rooms(text) or self.extract_rooms(str(parent))
+        
+        price_byn, price_usd = self._extract_marked_price(text)
+        
+        # Тип арендодателя считаем известным, только если карточка явно его указывает
+        landlord_known = bool(_RE_OWNER.search(text) or _RE_AGENT.search(text))
+        
+        card_data = {
+            'address': address,
+            'rooms': rooms,
+            'price_byn': price_byn,
+            'price_usd': price_usd,
+            'landlord': self._extract_landlord(text, text_lower),
+        }
+        complete = (
+            (price_byn is not None or price_usd is not None)
+            and address not in ('', 'Минск')
+            and landlord_known
+        )
+        return card_data, complete
+    
+    @staticmethod
+    def _build_listing(
+        href: str,
+        address: Optional[str],
+        rooms: Optional[int],
+        price_byn: Optional[float],
+        price_usd: Optional[float],
+        landlord: str
+    ) -> Listing:
+        """
+        Сформировать объявление Domovita.
+        
+        Args:
+            href: Нормализованный URL объявления
+            address: Адрес
+            rooms: Количество комнат
+            price_byn: Цена в BYN
+            price_usd: Цена в USD
+            landlord: Тип арендодателя
+        
+        Returns:
+            Listing: Данные объявления
+        """
+        return Listing(
+            listing_id=make_listing_id(href),
+            source='Domovita',
+            address=address or 'Адрес не указан',
+            rooms=rooms,
+            price_byn=price_byn,
+            price_usd=price_usd,
+            landlord=landlord,
+            url=href
+        )
+    
     def _parse_listing_from_container(
         self,
         container,
         base_url: str
-    ) -> Optional[Dict]:
+    ) -> Optional[Listing]:
         """
         Парсинг объявления из контейнера.
         
@@ -381,22 +609,24 @@ class DomovitaParser(BaseParser):
             base_url: Базовый URL
         
         Returns:
-            Optional[Dict]: Данные объявления или None
+            Optional[Listing]: Данные объявления или None
         """
         try:
             text = container.get_text(' ', strip=True)
+            # Нижний регистр считаем один раз для всех проверок ниже
+            text_lower = text.lower()
             
             # Улучшенный поиск ссылки на объявление
             href = ''
             
             # 1. Ищем прямую ссылку в контейнере
-            link = container.find('a', href=re.compile(r'/minsk/flats/rent/|/object/|/flats/rent/'))
+            link = container.find('a', href=_RE_FALLBACK_HREF)
             if link:
                 href = link.get('href', '')
             
             # 2. Если не нашли, ищем в дочерних элементах
             if not href:
-                links = container.find_all('a', href=re.compile(r'/minsk/flats/rent/|/object/|/flats/rent/'))
+                links = container.find_all('a', href=_RE_FALLBACK_HREF)
                 if links:
                     href = links[0].get('href', '')
             
@@ -408,22 +638,15 @@ class DomovitaParser(BaseParser):
             
             # 4. Если не нашли, ищем в родительском элементе
             if not href:
-                parent = container.find_parent(['div', 'article', 'li'])
+                parent = self._find_card_parent(container)
                 if parent:
-                    parent_link = parent.find('a', href=re.compile(r'/minsk/flats/rent/|/object/|/flats/rent/'))
+                    parent_link = parent.find('a', href=_RE_FALLBACK_HREF)
                     if parent_link:
                         href = parent_link.get('href', '')
             
             # Формируем полный URL
             if href:
-                if not href.startswith('http'):
-                    href = href.lstrip('/')
-                    href = 'https://domovita.by/' + href
-                # Убираем лишние параметры
-                if '?' in href:
-                    href = href.split('?')[0]
-                if '#' in href:
-                    href = href.split('#')[0]
+                href = self._normalize_href(href)
             
             # Если ссылка не найдена, пропускаем это объявление
             if not href or href == base_url or ('/flats/rent/' not in href and '/object/' not in href):
@@ -431,7 +654,7 @@ class DomovitaParser(BaseParser):
             
             # Извлечение адреса из специального элемента
             address = ''
-            address_elem = container.find(class_=re.compile(r'object-item__address|address'))
+            address_elem = container.find(class_=_RE_CLASS_ADDRESS)
             if address_elem:
                 address_link = address_elem.find('a')
                 if address_link:
@@ -444,7 +667,7 @@ class DomovitaParser(BaseParser):
             
             # Если не нашли в специальном элементе, используем общий метод
             if not address:
-                address = self._extract_address(text, container)
+                address = self._extract_address(text, container, text_lower)
             
             # Если адрес содержит "юридический", очищаем его
             if address and 'юридический' in address.lower():
@@ -452,17 +675,17 @@ class DomovitaParser(BaseParser):
             
             # Извлечение цены из специального элемента
             price_byn, price_usd = None, None
-            price_elem = container.find(class_=re.compile(r'object-item__price|price'))
+            price_elem = container.find(class_=_RE_CLASS_PRICE)
             if price_elem:
                 price_text = price_elem.get_text(' ', strip=True)
                 # Domovita часто показывает цены в формате "247 р. за сутки" или "500 $"
-                price_byn, price_usd = self.extract_price(price_text)
+                price_byn, price_usd = self._extract_marked_price(price_text)
                 # Если нашли только BYN и это аренда на длительный срок, конвертируем примерно
                 # (но лучше не конвертировать автоматически, так как курс может меняться)
             
             # Если не нашли цену в специальном элементе, парсим весь текст
             if not price_usd and not price_byn:
-                price_byn, price_usd = self.extract_price(text)
+                price_byn, price_usd = self._extract_marked_price(text)
             
             # Извлечение комнат - проверяем alt текст изображений и ссылки
             rooms = None
@@ -471,18 +694,19 @@ class DomovitaParser(BaseParser):
             img_elems = container.find_all('img', alt=True)
             for img_elem in img_elems:
                 alt_text = img_elem.get('alt', '')
-                if 'комнатн' in alt_text.lower() or 'комн' in alt_text.lower():
+                # 'комн' покрывает и 'комнатн'
+                if 'комн' in alt_text.lower():
                     rooms = self.extract_rooms(alt_text)
                     if rooms is not None:
                         break
             
             # 2. Проверяем ссылки - в URL может быть информация о комнатах
             if rooms is None:
-                link = container.find('a', href=re.compile(r'/flats/rent/|/flats-for-day/rent/|/minsk/flats/rent/'))
+                link = container.find('a', href=_RE_LISTING_HREF)
                 if link:
                     link_href = link.get('href', '')
                     # Ищем паттерны типа /1-room-flats/, /2-room-flats/ и т.д.
-                    room_match = re.search(r'/(\d+)-room-flats/', link_href)
+                    room_match = _RE_ROOM_FLATS.search(link_href)
                     if room_match:
                         try:
                             rooms = int(room_match.group(1))
@@ -490,7 +714,7 @@ class DomovitaParser(BaseParser):
                             pass
                     # Также проверяем паттерн типа "2-komnatnaa-kvartira" в URL
                     if rooms is None:
-                        room_match = re.search(r'/(\d+)-komnatnaa', link_href, re.IGNORECASE)
+                        room_match = _RE_ROOMS_URL.search(link_href)
                         if room_match:
                             try:
                                 rooms = int(room_match.group(1))
@@ -503,7 +727,7 @@ class DomovitaParser(BaseParser):
             
             # 3. Если не нашли, пробуем извлечь из href контейнера
             if rooms is None and href:
-                room_match = re.search(r'/(\d+)-komnatnaa', href, re.IGNORECASE)
+                room_match = _RE_ROOMS_URL.search(href)
                 if room_match:
                     try:
                         rooms = int(room_match.group(1))
@@ -515,47 +739,48 @@ class DomovitaParser(BaseParser):
                 rooms = self.extract_rooms(text)
             
             # Извлекаем арендодателя
-            landlord = self._extract_landlord(text)
+            landlord = self._extract_landlord(text, text_lower)
             # По умолчанию - большинство объявлений от собственников
             if not landlord:
                 landlord = "Собственник"
             
-            listing_id = hashlib.md5(href.encode()).hexdigest()
-            
-            return {
-                'listing_id': listing_id,
-                'source': 'Domovita',
-                'address': address or 'Адрес не указан',
-                'rooms': rooms,
-                'price_byn': price_byn,
-                'price_usd': price_usd,
-                'landlord': landlord,
-                'url': href
-            }
+            return self._build_listing(href, address, rooms, price_byn, price_usd, landlord)
         except Exception as e:
             logger.error(f"Ошибка парсинга контейнера Domovita: {e}")
             return None
     
-    def _extract_address(self, text: str, element) -> str:
+    def _extract_marked_price(self, text: str) -> Tuple[Optional[float], Optional[float]]:
+        """
+        Извлечь цены, не запуская шаблоны для текста без обозначения валюты.
+        
+        Блоки с классом "price" часто содержат только подписи ("за сутки",
+        "Цена договорная"), для них extract_price заведомо вернёт (None, None).
+        
+        Args:
+            text: Текст для поиска
+        
+        Returns:
+            Tuple[Optional[float], Optional[float]]: (цена BYN, цена USD)
+        """
+        if not _RE_PRICE_MARKER.search(text):
+            return None, None
+        return self.extract_price(text)
+    
+    def _extract_address(self, text: str, element, text_lower: Optional[str] = None) -> str:
         """
         Извлечь адрес из текста или элемента.
         
         Args:
             text: Текст для поиска
             element: Элемент BeautifulSoup
+            text_lower: Уже посчитанный text.lower() (если есть у вызывающего)
         
         Returns:
             str: Адрес или пустая строка
         """
         # Поиск адреса в тексте (Минск, улица...) - улучшенные паттерны
-        address_patterns = [
-            r'Минск[,\s]+(?:ул\.|улица|пр\.|проспект|пер\.|переулок|бул\.|бульвар)?\s*([А-Яа-я\s\d,.-]+)',
-            r'Минск[,\s]+([А-Яа-я\s\d,.-]{3,})',
-            r'г\.?\s*Минск[,\s]+([А-Яа-я\s\d,.-]+)',
-        ]
-        
-        for pattern in address_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in _ADDRESS_PATTERNS:
+            match = pattern.search(text)
             if match:
                 address_part = match.group(1).strip()
                 if len(address_part) > 100:
@@ -569,29 +794,27 @@ class DomovitaParser(BaseParser):
                 return address_attr
         
         # Попробуем найти упоминание Минска
-        if 'минск' in text.lower():
-            minsk_match = re.search(r'минск[,\s]+([а-яё\s\d,.-]{5,50})', text.lower())
+        if text_lower is None:
+            text_lower = text.lower()
+        if 'минск' in text_lower:
+            minsk_match = _RE_MINSK_ADDR.search(text_lower)
             if minsk_match:
                 return f"Минск, {minsk_match.group(1).strip().title()}"
             return "Минск"
         
         return ""
     
-    def _extract_landlord(self, text: str) -> str:
+    def _extract_landlord(self, text: str, text_lower: Optional[str] = None) -> str:
         """
         Извлечь тип арендодателя из текста.
         
         Args:
             text: Текст для анализа
+            text_lower: Уже посчитанный text.lower() (если есть у вызывающего)
         
         Returns:
             str: "Собственник" или "Агентство"
         """
-        text_lower = text.lower()
-        if any(keyword in text_lower for keyword in [
-            'от собственника', 'собственник', 'без посредников', 
-            'напрямую от собственника', 'хозяин', 'владелец',
-            'от хозяина', 'напрямую', 'без агентств'
-        ]):
+        if _RE_OWNER.search(text_lower if text_lower is not None else text):
             return "Собственник"
         return "Агентство"
@@ -1,16 +1,487 @@
 """Парсер для Kufar.by."""
 import re
-import hashlib
+import json
+import asyncio
 import logging
-from typing import List, Dict, Optional
-from bs4 import BeautifulSoup, Tag
+import threading
+from functools import lru_cache, partial
+from typing import AsyncIterator, Iterator, List, Dict, Optional, Set, Tuple
+from bs4 import BeautifulSoup, NavigableString, SoupStrainer, Tag
+from lxml import etree, html as lxml_html
 
-from .base import BaseParser
+from .base import BaseParser, make_listing_id, strip_xml_declaration, _CACHEABLE_TEXT_LEN, _extract_rooms
+from .listing import Listing
 from .selenium_base import SeleniumBaseParser
 from config import settings
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# Разбор JSON: orjson (если установлен) заметно быстрее на больших __NEXT_DATA__.
+# orjson.JSONDecodeError наследует json.JSONDecodeError, поэтому обработка ошибок общая
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+_SITE_PREFIX = 'https://re.kufar.by/'
+
+# Тег с данными Next.js в разметке страницы: его содержимое вырезается из строки без разбора HTML
+_NEXT_DATA_ID = 'id="__NEXT_DATA__"'
+_SCRIPT_CLOSE = '</script>'
+
+# Тексты скриптов страницы списка: JSON с объявлениями читается без построения дерева bs4
+_XPATH_NEXT_DATA = etree.XPath('//script[@id="__NEXT_DATA__" and @type="application/json"]/text()')
+_XPATH_SCRIPT_TEXTS = etree.XPath('//script/text()')
+# Текст страницы без скриптов, стилей и шаблонов — те же строки, что отдаёт get_text() в bs4
+_XPATH_PAGE_TEXT = etree.XPath('//text()[not(ancestor::script or ancestor::style or ancestor::template)]')
+_parser_local = threading.local()
+_RE_AD_ID = re.compile(r'"ad_id"\s*:\s*(\d+)')
+# Ключ массива объявлений в JSON скриптов страницы списка
+_ADS_KEY = '"ads"'
+# Строковые литералы JSON целиком и фигурные скобки: скобки внутри строк не считаются
+_RE_JSON_BRACES = re.compile(r'"(?:[^"\\]|\\.)*"|[{}]', re.DOTALL)
+_RE_NUMERIC_ID = re.compile(r'^\d+$')
+_RE_NON_DIGITS = re.compile(r'\D+')
+# Карточки объявлений с числовым data-id: первым разбором строим дерево только из них
+_DATA_ID_STRAINER = SoupStrainer(['div', 'article'], attrs={'data-id': _RE_NUMERIC_ID})
+# Стратегии поиска объявлений в HTML страницы списка в порядке приоритета
+_HTML_STRATEGIES = ('data_id', 'class', 'links')
+# Проверка по дереву lxml, есть ли на странице узлы стратегии (те же условия, что в _find_strategy_nodes):
+# дерево bs4 строится только для стратегии, которой есть что разбирать
+_STRATEGY_PROBES = {
+    'data_id': etree.XPath(
+        'boolean((//div | //article)[@data-id != "" and translate(@data-id, "0123456789", "") = ""])'
+    ),
+    'class': etree.XPath(
+        'boolean(//div[contains(@class, "listing") or contains(@class, "ad")'
+        ' or contains(@class, "item") or contains(@class, "card")])'
+    ),
+    'links': etree.XPath('boolean(//a[contains(@href, "/v/")])'),
+}
+# CSS-селекторы по подстроке в class (styles_item и т.п. покрываются более коротким вариантом)
+_SEL_CONTAINER_CLASS = 'div[class*="listing"], div[class*="ad"], div[class*="item"], div[class*="card"]'
+_RE_AD_HREF = re.compile(r'/v/\d+')
+_RE_LINK_HREF = re.compile(r'/v/')
+# Подстроки class блоков цены, адреса, комнат и арендодателя (на странице объявления и в карточке списка)
+_FIELD_BLOCK_CLASSES = (
+    ('price', ('price', 'cost', 'amount')),
+    ('address', ('address', 'location', 'place')),
+    ('rooms', ('room', 'param')),
+    ('owner', ('owner', 'landlord', 'agent')),
+)
+_FIELD_CLASS_KIND = {part: name for name, parts in _FIELD_BLOCK_CLASSES for part in parts}
+# Все подстроки одной регуляркой; просмотр вперёд находит и перекрывающиеся вхождения
+_RE_FIELD_CLASS = re.compile(
+    '(?=(' + '|'.join(part for _, parts in _FIELD_BLOCK_CLASSES for part in parts) + '))'
+)
+# Хвост адреса ограничен _ADDRESS_MAX_LEN символами (длиннее всё равно обрезается),
+# чтобы на длинном тексте карточки движок не сканировал и не откатывал весь остаток строки
+_ADDRESS_MAX_LEN = 100
+_ADDRESS_PATTERNS = (
+    re.compile(r'Минск[,\s]+(?:ул\.|улица|пр\.|проспект|пер\.|переулок|бул\.|бульвар)?\s*([А-Яа-я\s\d,.-]{1,100})', re.IGNORECASE),
+    re.compile(r'Минск[,\s]+([А-Яа-я\s\d,.-]{3,100})', re.IGNORECASE),
+    re.compile(r'г\.?\s*Минск[,\s]+([А-Яа-я\s\d,.-]{1,100})', re.IGNORECASE),
+)
+# Признаки, без которых extract_price, extract_rooms и _extract_landlord по тексту ничего не найдут:
+# обозначение валюты, число перед "к" ("2-комн", "1 к.") и слова собственника
+_RE_FIELD_MARKERS = re.compile(
+    r'(?P<price>\$|usd|долл|byn|р\.|руб|р/мес)'
+    r'|(?P<rooms>\d(?:-|\s*)к)'
+    r'|(?P<owner>собственник|без посредников|хозяин|владелец|напрямую|без агентств)',
+    re.IGNORECASE
+)
+_RE_MINSK = re.compile(r'минск', re.IGNORECASE)
+_RE_MINSK_ADDR = re.compile(r'минск[,\s]+([а-яё\s\d,.-]{5,50})', re.IGNORECASE)
+# Слова, по которым объявление считается от собственника, одной альтернацией
+# ("от собственника", "от хозяина", "напрямую от собственника" содержат более короткие слова)
+_RE_OWNER_KEYWORDS = re.compile(r'собственник|без посредников|хозяин|владелец|напрямую|без агентств')
+# Тип аккаунта (account_type) и параметр flat_rent_for_whom в JSON объявления
+_RE_ACCOUNT_OWNER = re.compile(r'owner|собственник|private|частное', re.IGNORECASE)
+_RE_ACCOUNT_AGENT = re.compile(r'agent|агент|company|компания', re.IGNORECASE)
+_RE_RENT_OWNER = re.compile(r'собственник|частное', re.IGNORECASE)
+_RE_RENT_AGENT = re.compile(r'агент|компания', re.IGNORECASE)
+# Параметры ad_parameters с частями адреса
+_JSON_ADDRESS_PARAMS = frozenset(('address', 'region', 'area'))
+
+
+def _get_lxml_parser() -> lxml_html.HTMLParser:
+    """
+    Получить HTML-парсер lxml текущего потока.
+    
+    Парсер создаётся один раз на поток (экземпляр парсера lxml нельзя делить между потоками)
+    и не создаёт узлы для комментариев, инструкций обработки и пустого текста.
+    
+    Returns:
+        lxml_html.HTMLParser: Парсер для lxml_html.fromstring
+    """
+    parser = getattr(_parser_local, 'parser', None)
+    if parser is None:
+        parser = lxml_html.HTMLParser(remove_comments=True, remove_pis=True, remove_blank_text=True)
+        _parser_local.parser = parser
+    return parser
+
+
+@lru_cache(maxsize=1024)
+def _classify_field_class(class_value: str) -> Tuple[str, ...]:
+    """
+    Определить виды блока по значению class за один проход (классы карточек повторяются — результат кэшируется).
+    
+    Args:
+        class_value: Значение атрибута class
+    
+    Returns:
+        Tuple[str, ...]: Виды 'price', 'address', 'rooms', 'owner' в порядке _FIELD_BLOCK_CLASSES
+    """
+    kinds = {_FIELD_CLASS_KIND[part] for part in _RE_FIELD_CLASS.findall(class_value)}
+    return tuple(name for name, _ in _FIELD_BLOCK_CLASSES if name in kinds)
+
+
+def _is_detail_block(name: str, attrs: Dict) -> bool:
+    """
+    Отобрать теги страницы объявления, которые нужны парсеру.
+    
+    Args:
+        name: Имя тега
+        attrs: Атрибуты тега
+        
+    Returns:
+        bool: True, если тег нужно сохранить в дереве
+    """
+    if name == 'title':
+        return True
+    classes = attrs.get('class') or ''
+    if not isinstance(classes, str):
+        classes = ' '.join(classes)
+    return bool(_classify_field_class(classes))
+
+
+# lxml строит дерево bs4 только из <title> и блоков с полями, остальная разметка отбрасывается
+_DETAIL_STRAINER = SoupStrainer(_is_detail_block)
+
+
+def _page_text(html: str) -> str:
+    """
+    Текст всей страницы, как BeautifulSoup(html).get_text(' ', strip=True), но без дерева bs4.
+    
+    Args:
+        html: HTML страницы
+    
+    Returns:
+        str: Текстовые фрагменты страницы через пробел
+    """
+    tree = lxml_html.fromstring(strip_xml_declaration(html), parser=_get_lxml_parser())
+    return ' '.join(chunk for chunk in (part.strip() for part in _XPATH_PAGE_TEXT(tree)) if chunk)
+
+
+def _bucket_field_blocks(root) -> Dict[str, List[Tag]]:
+    """
+    Разложить блоки с полями объявления по видам за один обход дерева.
+    
+    Блок попадает в вид, если его class содержит одну из подстрок вида (как [class*="..."] в CSS);
+    один блок может попасть в несколько видов. Порядок блоков — порядок документа.
+    
+    Args:
+        root: Контейнер или страница объявления (BeautifulSoup/Tag)
+    
+    Returns:
+        Dict[str, List[Tag]]: Блоки по видам 'price', 'address', 'rooms', 'owner'
+    """
+    buckets: Dict[str, List[Tag]] = {name: [] for name, _ in _FIELD_BLOCK_CLASSES}
+    for node in root.find_all(class_=True):
+        classes = node['class']
+        class_value = ' '.join(classes) if isinstance(classes, list) else classes
+        for name in _classify_field_class(class_value):
+            buckets[name].append(node)
+    return buckets
+
+
+def _block_text(node: Tag) -> str:
+    """Текст блока, как get_text(' ', strip=True); для блока с одной строкой — без обхода поддерева."""
+    string = node.string
+    if type(string) is NavigableString:
+        return string.strip()
+    return node.get_text(' ', strip=True)
+
+
+def _slice_object(text: str, pos: int) -> Optional[str]:
+    """
+    Вырезать JSON-объект, внутри которого находится позиция pos, подсчётом скобок.
+    
+    Назад идём до непарной "{" (скобки внутри строк перед pos не различаются),
+    вперёд — с учётом строк и экранирования до парной "}". Вложенные объекты допустимы.
+    
+    Args:
+        text: Текст скрипта
+        pos: Позиция внутри объекта (например, начало "ad_id")
+    
+    Returns:
+        Optional[str]: Текст объекта или None, если границы не найдены
+    """
+    depth = 0
+    start = pos - 1
+    while start >= 0:
+        char = text[start]
+        if char == '}':
+            depth += 1
+        elif char == '{':
+            if depth == 0:
+                break
+            depth -= 1
+        start -= 1
+    if start < 0:
+        return None
+    
+    depth = 0
+    for match in _RE_JSON_BRACES.finditer(text, start):
+        token = match.group()
+        if token == '{':
+            depth += 1
+        elif token == '}':
+            depth -= 1
+            if depth == 0:
+                return text[start:match.end()]
+    return None
+
+
+def _find_ads_array(script_text: str) -> Optional[List]:
+    """
+    Найти в тексте скрипта непустой массив объявлений "ads".
+    
+    Для каждого ключа "ads" вырезается объемлющий объект (_slice_object) и разбирается как JSON;
+    первый объект с непустым списком в "ads" даёт результат.
+    
+    Args:
+        script_text: Текст скрипта
+    
+    Returns:
+        Optional[List]: Объявления из JSON или None, если не найдены
+    """
+    pos = script_text.find(_ADS_KEY)
+    while pos != -1:
+        ad_object = _slice_object(script_text, pos)
+        if ad_object:
+            try:
+                data = _json_loads(ad_object)
+            except ValueError:
+                data = None
+            if isinstance(data, dict):
+                ads = data.get('ads')
+                if isinstance(ads, list) and ads:
+                    return ads
+        pos = script_text.find(_ADS_KEY, pos + len(_ADS_KEY))
+    return None
+
+
+def _slice_next_data(html: str) -> Optional[str]:
+    """
+    Вырезать JSON из <script id="__NEXT_DATA__" type="application/json"> поиском по строке.
+    
+    Args:
+        html: HTML страницы
+    
+    Returns:
+        Optional[str]: Содержимое тега или None, если тег в привычном виде не найден
+    """
+    id_pos = html.find(_NEXT_DATA_ID)
+    if id_pos == -1:
+        return None
+    tag_start = html.rfind('<', 0, id_pos)
+    tag_end = html.find('>', id_pos)
+    if tag_start == -1 or tag_end == -1:
+        return None
+    open_tag = html[tag_start:tag_end]
+    if not open_tag.startswith('<script') or 'application/json' not in open_tag:
+        return None
+    payload_end = html.find(_SCRIPT_CLOSE, tag_end)
+    if payload_end == -1:
+        return None
+    return html[tag_end + 1:payload_end]
+
+
+def _scan_field_markers(text: str) -> Set[str]:
+    """
+    Найти за один проход по тексту признаки полей объявления.
+    
+    Args:
+        text: Текст карточки объявления
+    
+    Returns:
+        Set[str]: Найденные признаки: 'price' (обозначение валюты), 'rooms' (число перед "к"),
+        'owner' (слова собственника)
+    """
+    found: Set[str] = set()
+    for match in _RE_FIELD_MARKERS.finditer(text):
+        found.add(match.lastgroup)
+        if len(found) == 3:
+            break
+    return found
+
+
+@lru_cache(maxsize=4096)
+def _match_address(text: str) -> Tuple[str, str]:
+    """
+    Найти адрес в тексте; результат кэшируется по тексту.
+    
+    Шаблоны нечувствительны к регистру, поэтому копия текста в нижнем регистре не нужна.
+    
+    Args:
+        text: Текст для поиска
+    
+    Returns:
+        Tuple[str, str]: (адрес по шаблонам, адрес по упоминанию Минска); пустая строка, если не найден
+    """
+    # Все шаблоны адреса привязаны к "Минск": без него регулярки не запускаем
+    if not _RE_MINSK.search(text):
+        return "", ""
+    
+    for pattern in _ADDRESS_PATTERNS:
+        match = pattern.search(text)
+        if match:
+            address_part = match.group(1).strip()
+            if len(address_part) > _ADDRESS_MAX_LEN:
+                address_part = address_part[:_ADDRESS_MAX_LEN]
+            return f"Минск, {address_part}", ""
+    
+    minsk_match = _RE_MINSK_ADDR.search(text)
+    if minsk_match:
+        return "", f"Минск, {minsk_match.group(1).strip().title()}"
+    return "", "Минск"
+
+
+@lru_cache(maxsize=4096)
+def _landlord_from_text(text_lower: str) -> str:
+    """Определить тип арендодателя по тексту в нижнем регистре; результат кэшируется по тексту."""
+    if _RE_OWNER_KEYWORDS.search(text_lower):
+        return "Собственник"
+    return "Агентство"
+
+
+def _clear_text_caches() -> None:
+    """
+    Очистить кэши адреса и арендодателя, ключи которых — целые тексты карточек.
+    
+    Повторы текстов важны в пределах одной страницы списка, поэтому кэши сбрасываются
+    перед каждым проходом: в памяти остаются тексты не больше чем одной страницы.
+    """
+    _match_address.cache_clear()
+    _landlord_from_text.cache_clear()
+
+
+def _find_rooms(text: str) -> Optional[int]:
+    """Извлечь количество комнат из текста (как BaseParser.extract_rooms)."""
+    if len(text) > _CACHEABLE_TEXT_LEN:
+        return _extract_rooms.__wrapped__(text)
+    return _extract_rooms(text)
+
+
+def _find_address(text: str, element=None) -> str:
+    """
+    Извлечь адрес из текста или data-атрибутов элемента.
+    
+    Args:
+        text: Текст для поиска
+        element: Элемент с data-address/data-location/data-addr (или None)
+    
+    Returns:
+        str: Адрес или пустая строка
+    """
+    # Кэшируются только короткие тексты (заголовки, карточки), как в extract_price
+    match_address = _match_address if len(text) <= _CACHEABLE_TEXT_LEN else _match_address.__wrapped__
+    address, minsk_address = match_address(text)
+    if address:
+        return address
+    
+    if hasattr(element, 'get'):
+        address_attr = element.get('data-address') or element.get('data-location') or element.get('data-addr')
+        if address_attr:
+            return address_attr
+    
+    return minsk_address
+
+
+def _find_landlord(text: str, text_lower: Optional[str] = None) -> str:
+    """Определить тип арендодателя по тексту (text_lower — уже посчитанный text.lower(), если есть)."""
+    if text_lower is None:
+        text_lower = text.lower()
+    if len(text_lower) > _CACHEABLE_TEXT_LEN:
+        return _landlord_from_text.__wrapped__(text_lower)
+    return _landlord_from_text(text_lower)
+
+
+def _ad_url_for(city: str, ad_id: str) -> str:
+    """Канонический URL объявления по городу (в формате URL) и ID."""
+    return f'{_SITE_PREFIX}vi/{city}/snyat/kvartiru/{ad_id}'
+
+
+def _canon_kufar_url(href: str, city: str) -> Optional[str]:
+    """
+    Привести ссылку на объявление к каноническому URL.
+    
+    Ссылка, уже имеющая вид _ad_url_for(city, ID), возвращается без разбора.
+    
+    Args:
+        href: Значение атрибута href
+        city: Город в формате URL
+    
+    Returns:
+        Optional[str]: URL объявления или None, если ссылка не ведёт на объявление
+    """
+    if not href:
+        return None
+    canonical_prefix = _ad_url_for(city, '')
+    if href.startswith(canonical_prefix) and href[len(canonical_prefix):].isdigit():
+        return href
+    if not href.startswith('http'):
+        href = _SITE_PREFIX + href.lstrip('/')
+    # Убираем лишние параметры и очищаем ID
+    _, found, listing_path = href.partition('/v/')
+    if found:
+        listing_path = listing_path.partition('?')[0].partition('#')[0]
+        # Очищаем ID от лишних символов (оставляем только цифры)
+        listing_id_clean = _RE_NON_DIGITS.sub('', listing_path)
+        if not listing_id_clean:
+            return None
+        href = _ad_url_for(city, listing_id_clean)
+    return href
+
+
+def _norm_json_prices(price_byn, price_usd) -> Tuple[Optional[float], Optional[float]]:
+    """
+    Привести цены из JSON Kufar к числам в рублях и долларах.
+    
+    Kufar может хранить цены в копейках/центах. USD больше 1000 для аренды — центы.
+    BYN больше 10000 — копейки, если курс BYN/USD больше 10 (нормальный ~2.9-3.0),
+    а при нулевой USD — если сумма больше 100000. Без USD цена BYN не пересчитывается.
+    
+    Args:
+        price_byn: Значение price_byn из JSON
+        price_usd: Значение price_usd из JSON
+    
+    Returns:
+        Tuple[Optional[float], Optional[float]]: (BYN, USD); (None, None), если значение не число
+    """
+    try:
+        if price_byn is not None and not isinstance(price_byn, (int, float)):
+            price_byn = float(price_byn)
+        if price_usd is not None and not isinstance(price_usd, (int, float)):
+            price_usd = float(price_usd)
+    except (ValueError, TypeError):
+        return None, None
+    
+    if price_usd is None:
+        return price_byn, None
+    if price_usd > 1000:
+        price_usd = price_usd / 100
+    if price_byn is not None and price_byn > 10000:
+        if price_usd > 0:
+            if price_byn > 10 * price_usd:
+                price_byn = price_byn / 100
+        elif price_byn > 100000:
+            price_byn = price_byn / 100
+    return price_byn, price_usd
+
 
 def _city_to_url_format(city: Optional[str]) -> str:
     """
@@ -40,22 +511,198 @@ def _city_to_url_format(city: Optional[str]) -> str:
     return city_map.get(city_lower, 'minsk')  # По умолчанию Минск, если город не найден
 
 
+
+def _resolve_landlord(ad_data: Dict, rent_for_whom: List[str], subject: str) -> str:
+    """
+    Определить арендодателя объявления из JSON Kufar: первый сработавший признак решает.
+    
+    Args:
+        ad_data: Объект объявления из JSON
+        rent_for_whom: Значения параметров flat_rent_for_whom
+        subject: Заголовок объявления
+    
+    Returns:
+        str: "Собственник" или "Агентство"
+    """
+    # Приоритет 1: company_ad - самый надежный индикатор (False — не компания, True — агентство)
+    company_ad = ad_data.get('company_ad')
+    if company_ad is False:
+        return "Собственник"
+    if company_ad is True:
+        return "Агентство"
+    
+    # Приоритет 2: account_type
+    account_type = ad_data.get('account_type') or ad_data.get('accountType')
+    if isinstance(account_type, str):
+        if _RE_ACCOUNT_OWNER.search(account_type):
+            return "Собственник"
+        if _RE_ACCOUNT_AGENT.search(account_type):
+            return "Агентство"
+    
+    # Приоритет 3: ad_parameters - параметр flat_rent_for_whom
+    for param_vl in rent_for_whom:
+        if _RE_RENT_OWNER.search(param_vl):
+            return "Собственник"
+        if _RE_RENT_AGENT.search(param_vl):
+            return "Агентство"
+    
+    # Приоритет 4: извлекаем из subject
+    if subject:
+        return _find_landlord(subject)
+    
+    # Приоритет 5: по умолчанию - большинство объявлений от собственников
+    return "Собственник"
+
+
+def _parse_json_ad(ad_data: Dict, city: str) -> Optional[Listing]:
+    """
+    Парсинг объявления из JSON данных Kufar.
+    
+    Функция модуля, а не метод: вызывается для каждого объявления из JSON страницы списка.
+    
+    Args:
+        ad_data: Объект объявления из JSON
+        city: Город в формате URL (для ссылки на объявление)
+    
+    Returns:
+        Optional[Listing]: Объявление или None, если данных недостаточно или они некорректны
+    """
+    try:
+        ad_id = ad_data.get('ad_id') or ad_data.get('id') or ad_data.get('adId')
+        if not ad_id:
+            return None
+        
+        # Очищаем ad_id от лишних символов и приводим к строке
+        ad_id = str(ad_id).strip()
+        # Убираем все нецифровые символы, кроме дефиса (если есть)
+        ad_id_clean = _RE_NON_DIGITS.sub('', ad_id)
+        if not ad_id_clean:
+            return None
+        
+        # Формируем правильную ссылку
+        href = _ad_url_for(city, ad_id_clean)
+        
+        # Извлекаем данные из JSON
+        subject = ad_data.get('subject') or ad_data.get('title') or ad_data.get('name', '')
+        
+        # Параметры объявления — за один проход: комнаты (первый параметр rooms),
+        # части адреса и значения flat_rent_for_whom. Для большинства объявлений
+        # арендодателя решает company_ad — тогда flat_rent_for_whom не собираем
+        rent_needed = type(ad_data.get('company_ad')) is not bool
+        rooms_str = None
+        address_parts = []
+        rent_for_whom = []
+        ad_parameters = ad_data.get('ad_parameters', [])
+        if isinstance(ad_parameters, list):
+            for param in ad_parameters:
+                # json/orjson создают только dict, поэтому достаточно точной проверки типа
+                if type(param) is not dict:
+                    continue
+                param_p = param.get('p')
+                if param_p == 'rooms':
+                    if rooms_str is None:
+                        rooms_str = param.get('v', '')
+                elif param_p in _JSON_ADDRESS_PARAMS:
+                    addr_value = param.get('v')
+                    if isinstance(addr_value, str) and _RE_MINSK.search(addr_value):
+                        address_parts.append(addr_value)
+                elif param_p == 'flat_rent_for_whom' and rent_needed:
+                    param_vl = param.get('vl') or param.get('v')
+                    if isinstance(param_vl, str):
+                        rent_for_whom.append(param_vl)
+        
+        # Ищем комнаты - сначала в ad_parameters, потом в subject
+        rooms = None
+        if rooms_str:
+            try:
+                rooms = int(rooms_str)
+            except (ValueError, TypeError):
+                rooms = _find_rooms(str(rooms_str))
+        
+        # Если не нашли в параметрах, извлекаем из subject
+        if rooms is None:
+            rooms = _find_rooms(subject)
+        
+        # Ищем цену - Kufar хранит price_byn и price_usd напрямую
+        price_byn, price_usd = _norm_json_prices(ad_data.get('price_byn'), ad_data.get('price_usd'))
+        
+        # Ищем адрес - в account_parameters с p='address'
+        address = ''
+        account_parameters = ad_data.get('account_parameters', [])
+        if isinstance(account_parameters, list):
+            for param in account_parameters:
+                if type(param) is dict and param.get('p') == 'address':
+                    address = param.get('v', '')
+                    if address:
+                        break
+        
+        # Если не нашли в account_parameters, ищем в ad_parameters
+        if not address:
+            address = ', '.join(address_parts)
+        
+        # Если не нашли адрес, пробуем извлечь из subject
+        if not address or address == '':
+            if subject:
+                address = _find_address(subject)
+        
+        landlord = _resolve_landlord(ad_data, rent_for_whom, subject)
+        
+        listing_id = make_listing_id(href)
+        
+        return Listing(
+            listing_id=listing_id,
+            source='Kufar',
+            address=address or 'Адрес не указан',
+            rooms=rooms,
+            price_byn=price_byn,
+            price_usd=price_usd,
+            landlord=landlord,
+            url=href
+        )
+    except Exception as e:
+        logger.error(f"Ошибка парсинга объявления из JSON: {e}")
+        # Трассировка форматируется, только если DEBUG-запись действительно выводится
+        logger.debug("Трассировка ошибки парсинга объявления из JSON", exc_info=True)
+        return None
+
+
 class KufarParser(BaseParser):
     """Парсер для Kufar.by с использованием Chromium (общий браузер при передаче selenium_parser)."""
     
+    # Стратегия поиска объявлений в HTML, сработавшая для URL поиска (общая для всех экземпляров)
+    _strategy_cache: Dict[str, str] = {}
+    
     def __init__(self, selenium_parser=None):
         """Инициализация парсера. Если передан selenium_parser — используется общий Chromium."""
         BaseParser.__init__(self, selenium_parser=selenium_parser)
         self.selenium_parser = selenium_parser or SeleniumBaseParser(shared=True)
         self._own_selenium = selenium_parser is None
         self.current_city = "minsk"  # По умолчанию Минск
+        # Пул браузеров для страниц объявлений: создаётся при первой загрузке через Chromium
+        self._browser_pool: Optional[asyncio.Queue] = None
+        self._extra_browsers: List[SeleniumBaseParser] = []
     
-    def __del__(self):
-        """Деструктор — закрываем драйвер только если создавали сами."""
-        if getattr(self, '_own_selenium', True) and hasattr(self, 'selenium_parser'):
+    def close(self) -> None:
+        """Закрыть браузеры, созданные парсером (переданный снаружи общий Chromium не закрывается)."""
+        if self._own_selenium:
             self.selenium_parser.close()
+        for browser in self._extra_browsers:
+            browser.close()
+        self._extra_browsers = []
+        self._browser_pool = None
+    
+    async def aclose(self) -> None:
+        """Закрыть браузеры парсера, не блокируя event loop (остановка Chromium — в пуле потоков)."""
+        loop = asyncio.get_event_loop()
+        await loop.run_in_executor(None, self.close)
+    
+    async def __aenter__(self) -> 'KufarParser':
+        return self
     
-    async def parse_listings(self, url: str, city: Optional[str] = None) -> List[Dict]:
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.aclose()
+    
+    async def parse_listings(self, url: str, city: Optional[str] = None) -> List[Listing]:
         """
         Парсинг объявлений с Kufar.
         
@@ -64,8 +711,23 @@ class KufarParser(BaseParser):
             city: Название города (например, "Минск", "Брест"). По умолчанию "Минск"
         
         Returns:
-            List[Dict]: Список объявлений
+            List[Listing]: Список объявлений
+        """
+        return [listing async for listing in self.parse_listings_iter(url, city=city)]
+    
+    async def parse_listings_iter(self, url: str, city: Optional[str] = None) -> AsyncIterator[Listing]:
+        """
+        Потоковый парсинг объявлений с Kufar: объявления выдаются по мере извлечения.
+        
+        Args:
+            url: Базовый URL Kufar
+            city: Название города (например, "Минск", "Брест"). По умолчанию "Минск"
+        
+        Yields:
+            Listing: Данные объявления
         """
+        _clear_text_caches()
+        
         # Преобразуем город в формат URL
         city_url = _city_to_url_format(city)
         
@@ -76,246 +738,424 @@ class KufarParser(BaseParser):
         # Сохраняем город для использования при формировании ссылок
         self.current_city = city_url
         
+        # Разбор HTML и JSON — чистая работа CPU: выполняем её в пуле потоков,
+        # чтобы не блокировать event loop (остальные источники продолжают загружаться)
+        loop = asyncio.get_event_loop()
+        
+        # Kufar отдаёт __NEXT_DATA__ уже в серверном HTML: сначала пробуем обычный запрос,
+        # Chromium (с ожиданием до 20 с) нужен, только если объявлений в нём нет
+        html = await self.fetch_page(search_url)
+        if html and '__NEXT_DATA__' in html:
+            listings, _, _ = await loop.run_in_executor(None, self._parse_scripts_sync, html)
+            if listings:
+                for listing_data in listings:
+                    yield listing_data
+                return
+        
         # Используем Selenium для получения HTML (динамическая загрузка)
         # Увеличиваем время ожидания для Kufar, так как он загружает объявления динамически
-        html = await self.selenium_parser.fetch_page_selenium(search_url, wait_time=20)
+        browser_html = await self.selenium_parser.fetch_page_selenium(search_url, wait_time=20)
+        if browser_html:
+            html = browser_html
         if not html:
-            # Пробуем обычный метод как fallback
-            html = await self.fetch_page(search_url)
-        if not html:
-            return []
+            return
+        
+        listings, script_texts, strategies_present = await loop.run_in_executor(
+            None, self._parse_scripts_sync, html
+        )
+        if listings:
+            for listing_data in listings:
+                yield listing_data
+            return
+        
+        # Если не нашли в JSON, ищем ad_id в скриптах: за один проход запоминаем
+        # первое упоминание каждого ID (номер скрипта, позиция) в порядке страницы
+        ad_offsets: Dict[str, Tuple[int, int]] = {}
+        for script_index, script_text in enumerate(script_texts):
+            # Ищем паттерн "ad_id":число
+            for match in _RE_AD_ID.finditer(script_text):
+                ad_offsets.setdefault(match.group(1), (script_index, match.start()))
+        ad_ids = list(ad_offsets)
+        
+        # На странице нет ни ID в скриптах, ни узлов какой-либо стратегии — bs4 не нужен
+        if not ad_ids and not strategies_present:
+            return
+        
+        # Сначала разбираем только карточки с data-id; полное дерево строится,
+        # лишь если понадобятся запасные стратегии (классы, ссылки)
+        soup = await loop.run_in_executor(
+            None,
+            partial(BeautifulSoup, html, 'lxml', parse_only=_DATA_ID_STRAINER)
+        )
+        full_soup = False
+        found = False
+        links_parsed = False
+        
+        # Если нашли ID в скриптах, извлекаем данные из контейнеров на странице
+        if ad_ids:
+            logger.info(f"Найдено {len(ad_ids)} объявлений через ad_id в скриптах")
+            # Ищем контейнеры с этими ID; найденные разбираем параллельно в пуле потоков
+            ad_ids = ad_ids[:settings.max_listings_per_source]
+            containers = {ad_id: soup.find(attrs={'data-id': ad_id}) for ad_id in ad_ids}
+            # В дереве с data-id только div/article: ID, которых там нет, ищем по всей странице
+            missing_ids = [ad_id for ad_id in ad_ids if not containers[ad_id]]
+            if missing_ids:
+                soup = await loop.run_in_executor(None, BeautifulSoup, html, 'lxml')
+                full_soup = True
+                for ad_id in missing_ids:
+                    containers[ad_id] = soup.find(attrs={'data-id': ad_id})
+            container_results = dict(zip(
+                [ad_id for ad_id in ad_ids if containers[ad_id]],
+                await asyncio.gather(*(
+                    self._parse_listing_from_container(container, url)
+                    for container in containers.values() if container
+                ))
+            ))
+            for ad_id in ad_ids:
+                if containers[ad_id]:
+                    listing_data = container_results[ad_id]
+                    if listing_data:
+                        found = True
+                        yield listing_data
+                else:
+                    # Если контейнер не найден, ищем данные в скрипте по ID
+                    # (Kufar может хранить данные в JSON в скриптах): вырезаем объект
+                    # вокруг уже найденного упоминания ID
+                    href = self._ad_url(ad_id)
+                    listing_data = None
+                    script_index, offset = ad_offsets[ad_id]
+                    try:
+                        ad_object = _slice_object(script_texts[script_index], offset)
+                        if ad_object:
+                            ad_json = _json_loads(ad_object)
+                            listing_data = _parse_json_ad(ad_json, self.current_city)
+                    except Exception as e:
+                        logger.debug(f"Не удалось извлечь JSON объявления {ad_id}: {e}")
+                    
+                    # Если не нашли в JSON, создаем базовое объявление
+                    if not listing_data:
+                        listing_id = make_listing_id(href)
+                        listing_data = Listing(
+                            listing_id=listing_id,
+                            source='Kufar',
+                            address='Адрес не указан',
+                            rooms=None,
+                            price_byn=None,
+                            price_usd=None,
+                            landlord='',
+                            url=href
+                        )
+                    found = True
+                    yield listing_data
         
-        soup = BeautifulSoup(html, 'lxml')
+        # Также ищем в HTML структуре (на случай, если объявления уже загружены).
+        # Первой пробуем стратегию, которая сработала для этого URL в прошлый раз
+        if not found:
+            strategies = list(_HTML_STRATEGIES)
+            cached_strategy = self._strategy_cache.get(search_url)
+            if cached_strategy:
+                strategies.remove(cached_strategy)
+                strategies.insert(0, cached_strategy)
+            
+            for strategy in strategies:
+                if strategy not in strategies_present:
+                    continue
+                # Стратегиям по классам и ссылкам нужно полное дерево страницы
+                if strategy != 'data_id' and not full_soup:
+                    soup = await loop.run_in_executor(None, BeautifulSoup, html, 'lxml')
+                    full_soup = True
+                nodes = self._find_strategy_nodes(soup, strategy)
+                if not nodes:
+                    continue
+                if strategy == 'links':
+                    listings = await self._parse_links(nodes, url)
+                    links_parsed = True
+                else:
+                    listings = await self._parse_containers(nodes, url)
+                # Используется первая стратегия, нашедшая узлы
+                if listings:
+                    self._strategy_cache[search_url] = strategy
+                else:
+                    self._strategy_cache.pop(search_url, None)
+                break
+        
+        # Если все еще нет объявлений, пробуем более широкий поиск
+        # (если стратегия по ссылкам уже разобрала ссылки /v/, повторно их не загружаем)
+        if not found and not listings and not links_parsed and 'links' in strategies_present:
+            if not full_soup:
+                soup = await loop.run_in_executor(None, BeautifulSoup, html, 'lxml')
+            # Ищем ссылки с ID объявления
+            listings = await self._parse_links(soup.find_all('a', href=_RE_LINK_HREF), url)
+        
+        for listing_data in listings:
+            yield listing_data
+    
+    def _parse_scripts_sync(self, html: str) -> Tuple[List[Listing], List[str], Set[str]]:
+        """
+        Извлечь объявления из JSON в скриптах страницы списка (синхронно, выполняется в пуле потоков).
+        
+        Args:
+            html: HTML страницы списка
+        
+        Returns:
+            Tuple[List[Listing], List[str], Set[str]]: Объявления из JSON, тексты скриптов страницы
+            и стратегии из _HTML_STRATEGIES, для которых на странице есть узлы
+            (тексты и стратегии не собираются, если объявления нашлись в __NEXT_DATA__)
+        """
+        # Kufar (Next.js) отдаёт объявления в __NEXT_DATA__: вырезаем JSON из строки,
+        # не разбирая HTML. Дерево строится, только если объявлений там нет
+        next_data = _slice_next_data(html)
+        if next_data is not None:
+            listings = list(self._iter_next_data(next_data))
+            if listings:
+                return listings, [], set()
+        
+        # Для JSON в скриптах хватает дерева lxml; BeautifulSoup строим, только если JSON не найден
+        tree = lxml_html.fromstring(strip_xml_declaration(html), parser=_get_lxml_parser())
         listings = []
         
         # Kufar загружает объявления через JavaScript, их ID находятся в скриптах
         # Ищем ad_id в скриптах и извлекаем данные из JSON
-        import json
-        scripts = soup.find_all('script')
+        script_texts = _XPATH_SCRIPT_TEXTS(tree)
         
-        # Ищем скрипт с __NEXT_DATA__
-        next_data_script = soup.find('script', id='__NEXT_DATA__', type='application/json')
-        if next_data_script and next_data_script.string:
-            try:
-                data = json.loads(next_data_script.string)
-                # Ищем объявления в структуре данных
-                if 'props' in data and 'initialState' in data.get('props', {}):
-                    listing_state = data['props']['initialState'].get('listing', {})
-                    ads = listing_state.get('ads', [])
-                    if ads:
-                        logger.info(f"Найдено {len(ads)} объявлений в JSON данных")
-                        for ad in ads[:settings.max_listings_per_source]:
-                            try:
-                                listing_data = self._parse_listing_from_json(ad)
-                                if listing_data:
-                                    listings.append(listing_data)
-                            except Exception as e:
-                                logger.warning(f"Ошибка при парсинге объявления из JSON: {e}")
-                                continue
-            except Exception as e:
-                logger.debug(f"Не удалось извлечь JSON из __NEXT_DATA__: {e}")
+        # Тег __NEXT_DATA__ в непривычном виде (другой порядок атрибутов и т.п.) ищем по дереву
+        if next_data is None:
+            next_data_texts = _XPATH_NEXT_DATA(tree)
+            if next_data_texts:
+                listings = list(self._iter_next_data(next_data_texts[0]))
         
         # Если не нашли в __NEXT_DATA__, ищем в других скриптах
         if not listings:
-            for script in scripts:
-                if script.string and ('"ads"' in script.string or '"listing"' in script.string):
-                    try:
-                        # Ищем JSON объект в скрипте
-                        json_match = re.search(r'\{.*"ads".*\}', script.string, re.DOTALL)
-                        if json_match:
-                            try:
-                                data = json.loads(json_match.group(0))
-                                # Ищем объявления в разных местах структуры
-                                ads = []
-                                if isinstance(data, dict):
-                                    if 'ads' in data:
-                                        ads = data['ads'] if isinstance(data['ads'], list) else []
-                                    elif 'listing' in data and 'ads' in data['listing']:
-                                        ads = data['listing']['ads'] if isinstance(data['listing']['ads'], list) else []
-                                    elif 'initialState' in data and 'listing' in data['initialState']:
-                                        listing_state = data['initialState']['listing']
-                                        ads = listing_state.get('ads', []) if isinstance(listing_state, dict) else []
-                                
-                                if ads:
-                                    logger.info(f"Найдено {len(ads)} объявлений в JSON данных (альтернативный поиск)")
-                                    for ad in ads[:settings.max_listings_per_source]:
-                                        try:
-                                            listing_data = self._parse_listing_from_json(ad)
-                                            if listing_data:
-                                                listings.append(listing_data)
-                                        except Exception as e:
-                                            logger.warning(f"Ошибка при парсинге объявления из JSON: {e}")
-                                            continue
-                                    break
-                            except json.JSONDecodeError:
-                                continue
-                    except Exception as e:
-                        logger.debug(f"Ошибка при поиске JSON в скрипте: {e}")
-                        continue
+            for script_text in script_texts:
+                ads = _find_ads_array(script_text)
+                if ads:
+                    logger.info(f"Найдено {len(ads)} объявлений в JSON данных (альтернативный поиск)")
+                    city = self.current_city
+                    listings.extend(filter(None, (
+                        _parse_json_ad(ad, city) for ad in ads[:settings.max_listings_per_source]
+                    )))
+                    break
         
-        # Если не нашли в JSON, ищем ad_id в скриптах
-        if not listings:
-            ad_ids = set()
-            for script in scripts:
-                if script.string:
-                    # Ищем паттерн "ad_id":число
-                    matches = re.findall(r'"ad_id"\s*:\s*(\d+)', script.string)
-                    for match in matches:
-                        ad_ids.add(match)
-            
-            # Если нашли ID в скриптах, извлекаем данные из контейнеров на странице
-            if ad_ids:
-                logger.info(f"Найдено {len(ad_ids)} объявлений через ad_id в скриптах")
-                # Ищем контейнеры с этими ID
-                for ad_id in list(ad_ids)[:settings.max_listings_per_source]:
-                    container = soup.find(attrs={'data-id': ad_id})
-                    if container:
-                        listing_data = await self._parse_listing_from_container(container, url)
-                        if listing_data:
-                            listings.append(listing_data)
-                    else:
-                        # Если контейнер не найден, ищем данные в тексте страницы по ID
-                        # Пробуем найти упоминание этого ID в тексте или скриптах
-                        href = f'https://re.kufar.by/vi/{self.current_city}/snyat/kvartiru/{ad_id}'
-                        # Ищем в тексте страницы данные об этом объявлении
-                        # (Kufar может хранить данные в JSON в скриптах)
-                        listing_data = None
-                        for script in scripts:
-                            if script.string and str(ad_id) in script.string:
-                                # Пробуем извлечь данные из JSON
-                                try:
-                                    import json
-                                    # Ищем объект с этим ad_id
-                                    pattern = r'\{[^{}]*"ad_id"\s*:\s*' + str(ad_id) + r'[^{}]*\}'
-                                    json_match = re.search(pattern, script.string, re.DOTALL)
-                                    if json_match:
-                                        ad_json = json.loads(json_match.group(0))
-                                        listing_data = self._parse_listing_from_json(ad_json)
-                                        break
-                                except:
-                                    pass
-                        
-                        # Если не нашли в JSON, создаем базовое объявление
-                        if not listing_data:
-                            listing_id = hashlib.md5(href.encode()).hexdigest()
-                            listing_data = {
-                                'listing_id': listing_id,
-                                'source': 'Kufar',
-                                'address': 'Адрес не указан',
-                                'rooms': None,
-                                'price_byn': None,
-                                'price_usd': None,
-                                'landlord': None,
-                                'url': href
-                            }
-                        listings.append(listing_data)
-        
-        # Также ищем в HTML структуре (на случай, если объявления уже загружены)
-        listing_containers = []
-        if not listings:
+        if listings:
+            return listings, script_texts, set()
+        strategies_present = {strategy for strategy, probe in _STRATEGY_PROBES.items() if probe(tree)}
+        return listings, script_texts, strategies_present
+    
+    def _iter_next_data(self, payload: str) -> Iterator[Listing]:
+        """
+        Извлечь объявления из JSON __NEXT_DATA__ по одному.
+        
+        Args:
+            payload: Содержимое тега __NEXT_DATA__
+        
+        Yields:
+            Listing: Данные объявления
+        """
+        ads = []
+        try:
+            data = _json_loads(payload)
+            # Ищем объявления в структуре данных
+            if 'props' in data and 'initialState' in data.get('props', {}):
+                listing_state = data['props']['initialState'].get('listing', {})
+                ads = listing_state.get('ads', [])
+        except Exception as e:
+            logger.debug(f"Не удалось извлечь JSON из __NEXT_DATA__: {e}")
+            return
+        
+        if ads:
+            logger.info(f"Найдено {len(ads)} объявлений в JSON данных")
+            city = self.current_city
+            # _parse_json_ad сам перехватывает ошибки разбора и возвращает None
+            for listing_data in (_parse_json_ad(ad, city) for ad in ads[:settings.max_listings_per_source]):
+                if listing_data:
+                    yield listing_data
+    
+    @staticmethod
+    def _find_strategy_nodes(soup, strategy: str) -> List:
+        """
+        Найти узлы объявлений на странице списка по одной из стратегий.
+        
+        Args:
+            soup: Объект BeautifulSoup страницы
+            strategy: 'data_id' (карточки с data-id), 'class' (карточки по классу) или 'links' (ссылки /v/)
+        
+        Returns:
+            List: Найденные контейнеры или ссылки
+        """
+        if strategy == 'data_id':
             # Kufar использует структуру с data-id (только числовые ID)
-            listing_containers = soup.find_all(
-                ['div', 'article'],
-                attrs={'data-id': re.compile(r'^\d+$')}  # Только числовые ID
-            )
-            
+            return soup.find_all(['div', 'article'], attrs={'data-id': _RE_NUMERIC_ID})
+        if strategy == 'class':
             # Альтернативный поиск по классам
-            if not listing_containers:
-                listing_containers = soup.find_all(
-                    'div',
-                    class_=re.compile(r'styles_item|listing|ad|item|card')
-                )
-            
-            # Поиск по ссылкам
-            if not listing_containers:
-                # Ищем ссылки на объявления (обычно содержат /v/ с ID)
-                links = soup.find_all('a', href=re.compile(r'/v/\d+'))
-                # Если не нашли с ID, ищем любые ссылки /v/
-                if not links:
-                    links = soup.find_all('a', href=re.compile(r'/v/'))
-                
-                seen_urls = set()
-                for link in links[:settings.max_listings_per_source]:
-                    href = link.get('href', '')
-                    if href:
-                        if not href.startswith('http'):
-                            href = href.lstrip('/')
-                            href = 'https://re.kufar.by/' + href
-                        if '?' in href:
-                            href = href.split('?')[0]
-                        if '#' in href:
-                            href = href.split('#')[0]
-                        if href in seen_urls:
-                            continue
-                        seen_urls.add(href)
-                    try:
-                        listing_data = await self._parse_listing_from_link(link, url)
-                        if listing_data and listing_data['url'] not in [l['url'] for l in listings]:
-                            listings.append(listing_data)
-                    except Exception as e:
-                        logger.warning(f"Ошибка при парсинге объявления Kufar: {e}")
-                        continue
-            else:
-                seen_urls = set()
-                for container in listing_containers[:settings.max_listings_per_source]:
-                    try:
-                        listing_data = await self._parse_listing_from_container(container, url)
-                        if listing_data and listing_data['url'] not in [l['url'] for l in listings]:
-                            listings.append(listing_data)
-                    except Exception as e:
-                        logger.warning(f"Ошибка при парсинге контейнера Kufar: {e}")
-                        continue
+            return soup.select(_SEL_CONTAINER_CLASS)
+        # Ищем ссылки на объявления (обычно содержат /v/ с ID);
+        # если не нашли с ID, ищем любые ссылки /v/
+        return soup.find_all('a', href=_RE_AD_HREF) or soup.find_all('a', href=_RE_LINK_HREF)
+    
+    async def _parse_containers(self, containers: List, base_url: str) -> List[Listing]:
+        """
+        Разобрать контейнеры объявлений со страницы списка.
         
-        # Если все еще нет объявлений, пробуем более широкий поиск
-        if not listings:
-            all_links = soup.find_all('a', href=True)
-            for link in all_links:
-                href = link.get('href', '')
-                # Ищем ссылки с ID объявления
-                if '/v/' in href and href != url:
-                    listing_data = await self._parse_listing_from_link(link, url)
-                    if listing_data and listing_data not in listings:
-                        listings.append(listing_data)
-                        if len(listings) >= settings.max_listings_per_source:
-                            break
+        Args:
+            containers: Контейнеры объявлений
+            base_url: Базовый URL
         
+        Returns:
+            List[Listing]: Список объявлений
+        """
+        # Контейнеры разбираются параллельно в пуле потоков; порядок результатов — порядок контейнеров
+        results = await asyncio.gather(
+            *(
+                self._parse_listing_from_container(container, base_url)
+                for container in containers[:settings.max_listings_per_source]
+            ),
+            return_exceptions=True
+        )
+        listings = []
+        seen_urls = set()
+        for listing_data in results:
+            if isinstance(listing_data, Exception):
+                logger.warning(f"Ошибка при парсинге контейнера Kufar: {listing_data}")
+                continue
+            if listing_data and listing_data.url not in seen_urls:
+                seen_urls.add(listing_data.url)
+                listings.append(listing_data)
         return listings
     
+    async def _parse_links(self, links: List, base_url: str) -> List[Listing]:
+        """
+        Разобрать ссылки на объявления без дубликатов.
+        
+        Страницы объявлений загружаются пачками параллельно через один пул соединений
+        (fetch_many); через Chromium догружаются только те, что не отдались по HTTP.
+        Всего пробуется не больше 2 × max_listings_per_source ссылок.
+        
+        Args:
+            links: Элементы ссылок на объявления
+            base_url: Базовый URL
+        
+        Returns:
+            List[Listing]: Список объявлений (не больше max_listings_per_source)
+        """
+        max_listings = settings.max_listings_per_source
+        candidates = []  # (ссылка, URL объявления)
+        seen_urls = set()
+        for link in links:
+            href = self._listing_href(link.get('href', ''))
+            if href and href not in seen_urls:
+                seen_urls.add(href)
+                candidates.append((link, href))
+                # Если ссылки не дают объявлений, не загружаем все страницы подряд
+                if len(candidates) >= max_listings * 2:
+                    break
+        
+        listings = []
+        # Загружаем пачками ровно столько страниц, сколько объявлений не хватает
+        while candidates and len(listings) < max_listings:
+            batch = candidates[:max_listings - len(listings)]
+            candidates = candidates[len(batch):]
+            pages = await self.fetch_many([href for _, href in batch])
+            # Без данных Next.js это не страница объявления (заглушка, капча) — догружаем через Chromium;
+            # такие страницы загружаются параллельно окнами из пула браузеров
+            results = await asyncio.gather(
+                *(
+                    self._parse_listing_from_link(link, base_url, http_html)
+                    for (link, _), http_html in zip(batch, pages)
+                ),
+                return_exceptions=True
+            )
+            for listing_data in results:
+                if isinstance(listing_data, Exception):
+                    logger.warning(f"Ошибка при парсинге объявления Kufar: {listing_data}")
+                    continue
+                if listing_data:
+                    listings.append(listing_data)
+        return listings
+    
+    async def _fetch_listing_selenium(self, href: str) -> Optional[str]:
+        """
+        Загрузить страницу объявления через свободное окно из пула браузеров.
+        
+        В пуле settings.kufar_browser_pool окон: первое — браузер парсера, остальные
+        создаются при первом обращении. Запросы сверх размера пула ждут свободное окно;
+        пауза перед переходом выдерживается в окне под его блокировкой, поэтому и при
+        пуле из одного окна загрузки не идут подряд без паузы.
+        
+        Args:
+            href: URL объявления
+        
+        Returns:
+            Optional[str]: HTML страницы или None при ошибке
+        """
+        if self._browser_pool is None:
+            # Очередь создаётся до первого await: параллельные вызовы сразу берут общий браузер,
+            # а дополнительные окна добавляются в пул по мере запуска (запуск Chromium — в пуле потоков)
+            self._browser_pool = asyncio.Queue()
+            self._browser_pool.put_nowait(self.selenium_parser)
+            loop = asyncio.get_event_loop()
+            for _ in range(max(0, settings.kufar_browser_pool - 1)):
+                browser = await loop.run_in_executor(None, partial(SeleniumBaseParser, shared=False))
+                if not browser.driver:
+                    continue
+                self._extra_browsers.append(browser)
+                self._browser_pool.put_nowait(browser)
+        
+        browser = await self._browser_pool.get()
+        try:
+            return await browser.fetch_page_selenium(href, wait_time=8)
+        finally:
+            self._browser_pool.put_nowait(browser)
+    
+    def _ad_url(self, ad_id: str) -> str:
+        """
+        Сформировать канонический URL объявления по его ID.
+        
+        Args:
+            ad_id: Числовой ID объявления
+        
+        Returns:
+            str: URL объявления
+        """
+        return _ad_url_for(self.current_city, ad_id)
+    
+    def _listing_href(self, href: str) -> Optional[str]:
+        """
+        Привести ссылку на объявление к каноническому URL.
+        
+        Args:
+            href: Значение атрибута href
+        
+        Returns:
+            Optional[str]: URL объявления или None, если ссылка не ведёт на объявление
+        """
+        return _canon_kufar_url(href, self.current_city)
+    
     async def _parse_listing_from_link(
         self,
         link_element,
-        base_url: str
-    ) -> Optional[Dict]:
-        """Парсинг объявления из ссылки."""
+        base_url: str,
+        http_html: Optional[str] = None
+    ) -> Optional[Listing]:
+        """Парсинг объявления из ссылки (http_html — страница объявления, уже загруженная по HTTP, если есть)."""
         try:
-            href = link_element.get('href', '')
-            if href:
-                if not href.startswith('http'):
-                    href = href.lstrip('/')
-                    href = 'https://re.kufar.by/' + href
-                # Убираем лишние параметры и очищаем ID
-                if '/v/' in href:
-                    parts = href.split('/v/')
-                    if len(parts) > 1:
-                        listing_path = parts[1].split('?')[0].split('#')[0]
-                        # Очищаем ID от лишних символов (оставляем только цифры)
-                        listing_id_clean = ''.join(c for c in listing_path if c.isdigit())
-                        if listing_id_clean:
-                            href = f'https://re.kufar.by/vi/{self.current_city}/snyat/kvartiru/{listing_id_clean}'
-                        else:
-                            return None
-            else:
+            href = self._listing_href(link_element.get('href', ''))
+            if not href:
                 return None
             
-            # Загружаем страницу объявления для извлечения данных через Selenium
-            # (Kufar может блокировать обычные HTTP запросы)
-            listing_html = await self.selenium_parser.fetch_page_selenium(href, wait_time=8)
+            listing_html = http_html if http_html and '__NEXT_DATA__' in http_html else None
+            if not listing_html:
+                # Загружаем страницу объявления для извлечения данных через Selenium
+                # (Kufar может блокировать обычные HTTP запросы)
+                listing_html = await self._fetch_listing_selenium(href)
             if not listing_html:
-                # Fallback на обычный метод
-                listing_html = await self.fetch_page(href)
+                # Fallback на уже загруженный по HTTP ответ — повторный запрос вернул бы то же
+                listing_html = http_html
             if listing_html:
-                listing_soup = BeautifulSoup(listing_html, 'lxml')
-                text = listing_soup.get_text(' ', strip=True)
+                listing_soup = BeautifulSoup(listing_html, 'lxml', parse_only=_DETAIL_STRAINER)
+                # Для запасного поиска по всей странице текст берём из дерева lxml
+                text = _page_text(listing_html)
+                # Блоки с ценой, адресом, комнатами и арендодателем — за один обход страницы
+                blocks = _bucket_field_blocks(listing_soup)
                 
                 # Инициализируем переменные
                 rooms = None
@@ -335,9 +1175,8 @@ class KufarParser(BaseParser):
                 # Ищем цену в специальных элементах
                 if not price_usd and not price_byn:
                     # Ищем элементы с ценой
-                    price_elems = listing_soup.find_all(class_=re.compile(r'price|cost|amount|styles_price'))
-                    for price_elem in price_elems:
-                        price_text = price_elem.get_text(' ', strip=True)
+                    for price_elem in blocks['price']:
+                        price_text = _block_text(price_elem)
                         price_byn, price_usd = self.extract_price(price_text)
                         if price_usd or price_byn:
                             break
@@ -347,10 +1186,9 @@ class KufarParser(BaseParser):
                 
                 # Ищем адрес в специальных элементах
                 if not address:
-                    address_elems = listing_soup.find_all(class_=re.compile(r'address|location|place|styles_address'))
-                    for addr_elem in address_elems:
-                        addr_text = addr_elem.get_text(' ', strip=True)
-                        if 'минск' in addr_text.lower() and len(addr_text) > 5:
+                    for addr_elem in blocks['address']:
+                        addr_text = _block_text(addr_elem)
+                        if len(addr_text) > 5 and _RE_MINSK.search(addr_text):
                             address = self._extract_address(addr_text, addr_elem)
                             if address:
                                 break
@@ -360,9 +1198,8 @@ class KufarParser(BaseParser):
                 
                 # Ищем комнаты в специальных элементах
                 if rooms is None:
-                    rooms_elems = listing_soup.find_all(class_=re.compile(r'rooms|room|param|styles_rooms'))
-                    for room_elem in rooms_elems:
-                        room_text = room_elem.get_text(' ', strip=True)
+                    for room_elem in blocks['rooms']:
+                        room_text = _block_text(room_elem)
                         rooms = self.extract_rooms(room_text)
                         if rooms:
                             break
@@ -371,13 +1208,13 @@ class KufarParser(BaseParser):
                         rooms = self.extract_rooms(text)
                 
                 # Ищем арендодателя в специальных элементах
-                landlord_elems = listing_soup.find_all(class_=re.compile(r'owner|landlord|agent|styles_owner'))
-                for landlord_elem in landlord_elems:
-                    landlord_text = landlord_elem.get_text(' ', strip=True)
-                    if 'собственник' in landlord_text.lower() or 'от собственника' in landlord_text.lower():
+                for landlord_elem in blocks['owner']:
+                    landlord_text = _block_text(landlord_elem).lower()
+                    # 'собственник' покрывает 'от собственника', 'агент' — 'агентство'
+                    if 'собственник' in landlord_text:
                         landlord = "Собственник"
                         break
-                    elif 'агент' in landlord_text.lower() or 'агентство' in landlord_text.lower():
+                    elif 'агент' in landlord_text:
                         landlord = "Агентство"
                         break
                 # Если не нашли, ищем в тексте страницы
@@ -392,22 +1229,27 @@ class KufarParser(BaseParser):
                 text = parent.get_text(' ', strip=True)
                 
                 address = self._extract_address(text, parent)
-                rooms = self.extract_rooms(text) or self.extract_rooms(str(parent))
+                rooms = self.extract_rooms(text)
+                if rooms is None:
+                    # Комнаты могут быть только в атрибутах карточки (без сериализации всего HTML)
+                    rooms_attr = parent.get('data-rooms') or parent.get('title')
+                    if rooms_attr:
+                        rooms = int(rooms_attr) if rooms_attr.isdigit() else self.extract_rooms(rooms_attr)
                 price_byn, price_usd = self.extract_price(text)
                 landlord = self._extract_landlord(text)
             
-            listing_id = hashlib.md5(href.encode()).hexdigest()
+            listing_id = make_listing_id(href)
             
-            return {
-                'listing_id': listing_id,
-                'source': 'Kufar',
-                'address': address or 'Адрес не указан',
-                'rooms': rooms,
-                'price_byn': price_byn,
-                'price_usd': price_usd,
-                'landlord': landlord,
-                'url': href
-            }
+            return Listing(
+                listing_id=listing_id,
+                source='Kufar',
+                address=address or 'Адрес не указан',
+                rooms=rooms,
+                price_byn=price_byn,
+                price_usd=price_usd,
+                landlord=landlord,
+                url=href
+            )
         except Exception as e:
             logger.error(f"Ошибка парсинга объявления Kufar: {e}")
             return None
@@ -416,8 +1258,25 @@ class KufarParser(BaseParser):
         self,
         container,
         base_url: str
-    ) -> Optional[Dict]:
-        """Парсинг объявления из контейнера."""
+    ) -> Optional[Listing]:
+        """Парсинг объявления из контейнера (разбор выполняется в пуле потоков)."""
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(None, self._parse_container_sync, container, base_url)
+    
+    def _parse_container_sync(self, container, base_url: str) -> Optional[Listing]:
+        """
+        Парсинг объявления из контейнера (синхронно, без загрузки страниц).
+        
+        Контейнеры только читаются, поэтому несколько контейнеров одной страницы
+        можно разбирать в разных потоках одновременно.
+        
+        Args:
+            container: Контейнер объявления
+            base_url: Базовый URL
+        
+        Returns:
+            Optional[Listing]: Объявление или None, если контейнер не ведёт на объявление
+        """
         try:
             text = container.get_text(' ', strip=True)
             
@@ -431,10 +1290,10 @@ class KufarParser(BaseParser):
                 try:
                     # Очищаем data-id от лишних символов
                     data_id_clean = str(data_id).strip()
-                    data_id_clean = ''.join(c for c in data_id_clean if c.isdigit())
+                    data_id_clean = _RE_NON_DIGITS.sub('', data_id_clean)
                     if data_id_clean:
                         int(data_id_clean)  # Проверяем, что это число
-                        href = f'https://re.kufar.by/vi/{self.current_city}/snyat/kvartiru/{data_id_clean}'
+                        href = self._ad_url(data_id_clean)
                         data_id = data_id_clean
                     else:
                         data_id = None
@@ -444,13 +1303,13 @@ class KufarParser(BaseParser):
             
             # 2. Ищем прямую ссылку в контейнере
             if not href:
-                link = container.find('a', href=re.compile(r'/v/'))
+                link = container.find('a', href=_RE_LINK_HREF)
                 if link:
                     href = link.get('href', '')
             
             # 3. Если не нашли, ищем в дочерних элементах
             if not href:
-                links = container.find_all('a', href=re.compile(r'/v/'))
+                links = container.find_all('a', href=_RE_LINK_HREF)
                 if links:
                     href = links[0].get('href', '')
             
@@ -458,7 +1317,7 @@ class KufarParser(BaseParser):
             if not href:
                 parent = container.find_parent(['div', 'article', 'li'])
                 if parent:
-                    parent_link = parent.find('a', href=re.compile(r'/v/'))
+                    parent_link = parent.find('a', href=_RE_LINK_HREF)
                     if parent_link:
                         href = parent_link.get('href', '')
             
@@ -468,30 +1327,19 @@ class KufarParser(BaseParser):
             
             # Формируем полный URL
             if href:
-                if not href.startswith('http'):
-                    href = href.lstrip('/')
-                    href = 'https://re.kufar.by/' + href
-                # Убираем лишние параметры и очищаем ID
-                if '/v/' in href:
-                    parts = href.split('/v/')
-                    if len(parts) > 1:
-                        listing_path = parts[1].split('?')[0].split('#')[0]
-                        # Очищаем ID от лишних символов (оставляем только цифры)
-                        listing_id_clean = ''.join(c for c in listing_path if c.isdigit())
-                        if listing_id_clean:
-                            href = f'https://re.kufar.by/vi/{self.current_city}/snyat/kvartiru/{listing_id_clean}'
-                        else:
-                            return None
+                href = self._listing_href(href)
+                if not href:
+                    return None
             
             # Если ссылка не найдена, но есть data-id (число), формируем ссылку
             if not href and data_id:
                 try:
                     # Очищаем data-id от лишних символов
                     data_id_clean = str(data_id).strip()
-                    data_id_clean = ''.join(c for c in data_id_clean if c.isdigit())
+                    data_id_clean = _RE_NON_DIGITS.sub('', data_id_clean)
                     if data_id_clean:
                         int(data_id_clean)  # Проверяем, что это число
-                        href = f'https://re.kufar.by/vi/{self.current_city}/snyat/kvartiru/{data_id_clean}'
+                        href = self._ad_url(data_id_clean)
                     else:
                         return None
                 except (ValueError, TypeError):
@@ -510,8 +1358,9 @@ class KufarParser(BaseParser):
                 return None
             
             # Извлекаем данные из контейнера на главной странице (не загружаем отдельную страницу)
-            # Это быстрее и надежнее, так как многие объявления могут быть недоступны
-            text = container.get_text(' ', strip=True)
+            # Это быстрее и надежнее, так как многие объявления могут быть недоступны.
+            # Нижний регистр текста считаем один раз для всех проверок ниже
+            text_lower = text.lower()
             
             # Инициализируем переменные
             rooms = None
@@ -519,280 +1368,80 @@ class KufarParser(BaseParser):
             price_byn, price_usd = None, None
             landlord = None
             
-            # Ищем цену в контейнере - пробуем разные селекторы
-            price_elems = container.find_all(class_=re.compile(r'price|cost|amount|styles_price|styles_cost'))
-            for price_elem in price_elems:
-                price_text = price_elem.get_text(' ', strip=True)
+            # Один проход по тексту карточки: какие поля в нём вообще могут найтись.
+            # Экстракторы по всему тексту ниже запускаются только для них
+            markers = _scan_field_markers(text)
+            # Блоки с полями объявления — за один обход контейнера
+            blocks = _bucket_field_blocks(container)
+            
+            # Ищем цену в блоках контейнера
+            for price_elem in blocks['price']:
+                price_text = _block_text(price_elem)
                 price_byn, price_usd = self.extract_price(price_text)
                 if price_usd or price_byn:
                     break
             # Если не нашли в элементах, ищем в тексте контейнера
-            if not price_usd and not price_byn:
+            if not price_usd and not price_byn and 'price' in markers:
                 price_byn, price_usd = self.extract_price(text)
             
-            # Ищем адрес в контейнере - пробуем разные селекторы
-            address_elems = container.find_all(class_=re.compile(r'address|location|place|styles_address|styles_location'))
-            for addr_elem in address_elems:
-                addr_text = addr_elem.get_text(' ', strip=True)
-                if 'минск' in addr_text.lower() and len(addr_text) > 5:
-                    address = self._extract_address(addr_text, addr_elem)
-                    if address:
-                        break
+            # Ищем адрес в блоках контейнера (текст блока — часть текста карточки,
+            # поэтому без "минск" в карточке блоки не проверяем)
+            if 'минск' in text_lower:
+                for addr_elem in blocks['address']:
+                    addr_text = _block_text(addr_elem)
+                    if len(addr_text) > 5 and _RE_MINSK.search(addr_text):
+                        address = self._extract_address(addr_text, addr_elem)
+                        if address:
+                            break
             # Если не нашли в элементах, ищем в тексте контейнера
             if not address:
                 address = self._extract_address(text, container)
             
-            # Ищем комнаты в контейнере - пробуем разные селекторы
-            rooms_elems = container.find_all(class_=re.compile(r'rooms|room|param|styles_rooms|styles_param'))
-            for room_elem in rooms_elems:
-                room_text = room_elem.get_text(' ', strip=True)
+            # Ищем комнаты в блоках контейнера
+            for room_elem in blocks['rooms']:
+                room_text = _block_text(room_elem)
                 rooms = self.extract_rooms(room_text)
                 if rooms:
                     break
             # Если не нашли в элементах, ищем в тексте контейнера
-            if rooms is None:
+            if rooms is None and 'rooms' in markers:
                 rooms = self.extract_rooms(text)
             
-            # Ищем арендодателя в контейнере - пробуем разные селекторы
-            landlord_elems = container.find_all(class_=re.compile(r'owner|landlord|agent|styles_owner|styles_agent'))
-            for landlord_elem in landlord_elems:
-                landlord_text = landlord_elem.get_text(' ', strip=True)
-                if 'собственник' in landlord_text.lower() or 'от собственника' in landlord_text.lower():
-                    landlord = "Собственник"
-                    break
-                elif 'агент' in landlord_text.lower() or 'агентство' in landlord_text.lower():
-                    landlord = "Агентство"
-                    break
-            # Если не нашли в элементах, ищем в тексте контейнера
-            if not landlord:
-                landlord = self._extract_landlord(text)
-            
-            listing_id = hashlib.md5(href.encode()).hexdigest()
-            
-            return {
-                'listing_id': listing_id,
-                'source': 'Kufar',
-                'address': address or 'Адрес не указан',
-                'rooms': rooms,
-                'price_byn': price_byn,
-                'price_usd': price_usd,
-                'landlord': landlord,
-                'url': href
-            }
-        except Exception as e:
-            logger.error(f"Ошибка парсинга контейнера Kufar: {e}")
-            return None
-    
-    def _parse_listing_from_json(self, ad_data: Dict) -> Optional[Dict]:
-        """Парсинг объявления из JSON данных."""
-        try:
-            ad_id = ad_data.get('ad_id') or ad_data.get('id') or ad_data.get('adId')
-            if not ad_id:
-                return None
-            
-            # Очищаем ad_id от лишних символов и приводим к строке
-            ad_id = str(ad_id).strip()
-            # Убираем все нецифровые символы, кроме дефиса (если есть)
-            ad_id_clean = ''.join(c for c in ad_id if c.isdigit())
-            if not ad_id_clean:
-                return None
-            
-            # Формируем правильную ссылку
-            href = f'https://re.kufar.by/vi/{self.current_city}/snyat/kvartiru/{ad_id_clean}'
-            
-            # Извлекаем данные из JSON
-            subject = ad_data.get('subject', '') or ad_data.get('title', '') or ad_data.get('name', '')
-            
-            # Ищем комнаты - сначала в ad_parameters, потом в subject
-            rooms = None
-            ad_parameters = ad_data.get('ad_parameters', [])
-            if isinstance(ad_parameters, list):
-                for param in ad_parameters:
-                    if isinstance(param, dict) and param.get('p') == 'rooms':
-                        rooms_str = param.get('v', '')
-                        if rooms_str:
-                            try:
-                                rooms = int(rooms_str)
-                            except (ValueError, TypeError):
-                                rooms = self.extract_rooms(str(rooms_str))
-                        break
-            
-            # Если не нашли в параметрах, извлекаем из subject
-            if rooms is None:
-                rooms = self.extract_rooms(subject)
-            
-            # Ищем цену - Kufar хранит price_byn и price_usd напрямую
-            price_byn = ad_data.get('price_byn')
-            price_usd = ad_data.get('price_usd')
-            
-            # Конвертируем в числа, если нужно
-            try:
-                if price_byn is not None:
-                    price_byn = float(price_byn) if not isinstance(price_byn, (int, float)) else price_byn
-                if price_usd is not None:
-                    price_usd = float(price_usd) if not isinstance(price_usd, (int, float)) else price_usd
-                    
-                    # Если цены в неправильном формате (слишком большие числа), конвертируем
-                    # Kufar может хранить цены в копейках/центах
-                    # Проверяем: если цена USD больше 1000, вероятно это в центах (делим на 100)
-                    if isinstance(price_usd, (int, float)):
-                        if price_usd > 1000:
-                            # Вероятно, цена в центах - делим на 100
-                            price_usd = price_usd / 100
-                        elif price_usd > 5000:
-                            # Если очень большая, точно в центах
-                            price_usd = price_usd / 100
-                    
-                    if isinstance(price_byn, (int, float)):
-                        # BYN может быть в копейках - проверяем по разумности
-                        # Если цена больше 10000 BYN (для аренды это очень много), возможно в копейках
-                        # Также проверяем соотношение с USD: если BYN/USD > 10, вероятно в копейках
-                        if price_byn > 10000:
-                            # Проверяем соотношение с USD
-                            if price_usd and price_usd > 0:
-                                ratio = price_byn / price_usd
-                                # Нормальный курс ~2.9-3.0, если больше 10 - точно в копейках
-                                if ratio > 10:
-                                    price_byn = price_byn / 100
-                            else:
-                                # Если USD нет, но BYN очень большая, делим на 100
-                                if price_byn > 100000:
-                                    price_byn = price_byn / 100
-            except (ValueError, TypeError):
-                price_byn = None
-                price_usd = None
-            
-            # Ищем адрес - в account_parameters с p='address'
-            address = ''
-            account_parameters = ad_data.get('account_parameters', [])
-            if isinstance(account_parameters, list):
-                for param in account_parameters:
-                    if isinstance(param, dict) and param.get('p') == 'address':
-                        address = param.get('v', '')
-                        if address:
-                            break
-            
-            # Если не нашли в account_parameters, ищем в ad_parameters
-            if not address:
-                if isinstance(ad_parameters, list):
-                    for param in ad_parameters:
-                        if isinstance(param, dict) and param.get('p') in ['address', 'region', 'area']:
-                            addr_value = param.get('v', '')
-                            if addr_value and 'минск' in str(addr_value).lower():
-                                if not address:
-                                    address = str(addr_value)
-                                else:
-                                    address = f"{address}, {addr_value}"
-            
-            # Если не нашли адрес, пробуем извлечь из subject
-            if not address or address == '':
-                if subject:
-                    address = self._extract_address(subject, None)
-            
-            # Ищем арендодателя - company_ad=False обычно означает собственника
-            landlord = None
-            company_ad = ad_data.get('company_ad', None)
-            
-            # Приоритет 1: company_ad - самый надежный индикатор
-            if company_ad is False:
-                # Не компания, скорее всего собственник
-                landlord = "Собственник"
-            elif company_ad is True:
-                # Компания = агентство
-                landlord = "Агентство"
-            
-            # Приоритет 2: account_type
-            if not landlord:
-                account_type = ad_data.get('account_type', '') or ad_data.get('accountType', '')
-                if account_type:
-                    account_type_lower = str(account_type).lower()
-                    if any(keyword in account_type_lower for keyword in ['owner', 'собственник', 'private', 'частное']):
+            # Ищем арендодателя в блоках контейнера (так же только если слова есть в карточке)
+            if 'собственник' in text_lower or 'агент' in text_lower:
+                for landlord_elem in blocks['owner']:
+                    landlord_text = _block_text(landlord_elem).lower()
+                    # 'собственник' покрывает 'от собственника', 'агент' — 'агентство'
+                    if 'собственник' in landlord_text:
                         landlord = "Собственник"
-                    elif any(keyword in account_type_lower for keyword in ['agent', 'агент', 'company', 'компания']):
+                        break
+                    elif 'агент' in landlord_text:
                         landlord = "Агентство"
-            
-            # Приоритет 3: ad_parameters - ищем параметр flat_rent_for_whom
-            if not landlord:
-                if isinstance(ad_parameters, list):
-                    for param in ad_parameters:
-                        if isinstance(param, dict):
-                            param_p = param.get('p', '')
-                            param_vl = param.get('vl', '') or param.get('v', '')
-                            if param_p == 'flat_rent_for_whom' and param_vl:
-                                param_vl_lower = str(param_vl).lower()
-                                if any(keyword in param_vl_lower for keyword in ['собственник', 'от собственника', 'частное']):
-                                    landlord = "Собственник"
-                                    break
-                                elif any(keyword in param_vl_lower for keyword in ['агент', 'агентство', 'компания']):
-                                    landlord = "Агентство"
-                                    break
-            
-            # Приоритет 4: извлекаем из subject
-            if not landlord and subject:
-                landlord = self._extract_landlord(subject)
-            
-            # Приоритет 5: по умолчанию - большинство объявлений от собственников
+                        break
+            # Если не нашли в элементах, ищем в тексте контейнера
             if not landlord:
-                landlord = "Собственник"  # По умолчанию - собственник
+                landlord = "Собственник" if 'owner' in markers else "Агентство"
             
-            listing_id = hashlib.md5(href.encode()).hexdigest()
+            listing_id = make_listing_id(href)
             
-            return {
-                'listing_id': listing_id,
-                'source': 'Kufar',
-                'address': address or 'Адрес не указан',
-                'rooms': rooms,
-                'price_byn': price_byn,
-                'price_usd': price_usd,
-                'landlord': landlord,
-                'url': href
-            }
+            return Listing(
+                listing_id=listing_id,
+                source='Kufar',
+                address=address or 'Адрес не указан',
+                rooms=rooms,
+                price_byn=price_byn,
+                price_usd=price_usd,
+                landlord=landlord,
+                url=href
+            )
         except Exception as e:
-            logger.error(f"Ошибка парсинга объявления из JSON: {e}")
-            import traceback
-            logger.debug(traceback.format_exc())
+            logger.error(f"Ошибка парсинга контейнера Kufar: {e}")
             return None
     
     def _extract_address(self, text: str, element) -> str:
         """Извлечь адрес."""
-        address_patterns = [
-            r'Минск[,\s]+(?:ул\.|улица|пр\.|проспект|пер\.|переулок|бул\.|бульвар)?\s*([А-Яа-я\s\d,.-]+)',
-            r'Минск[,\s]+([А-Яа-я\s\d,.-]{3,})',
-            r'г\.?\s*Минск[,\s]+([А-Яа-я\s\d,.-]+)',
-        ]
-        
-        for pattern in address_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                address_part = match.group(1).strip()
-                if len(address_part) > 100:
-                    address_part = address_part[:100]
-                return f"Минск, {address_part}"
-        
-        if hasattr(element, 'get'):
-            address_attr = element.get('data-address') or element.get('data-location') or element.get('data-addr')
-            if address_attr:
-                return address_attr
-        
-        if 'минск' in text.lower():
-            minsk_match = re.search(r'минск[,\s]+([а-яё\s\d,.-]{5,50})', text.lower())
-            if minsk_match:
-                return f"Минск, {minsk_match.group(1).strip().title()}"
-            return "Минск"
-        
-        # Исключаем служебные адреса
-        if 'юридический адрес' in text.lower() or 'юридический' in text.lower():
-            return ""
-        
-        return ""
-    
-    def _extract_landlord(self, text: str) -> str:
-        """Извлечь тип арендодателя."""
-        text_lower = text.lower()
-        if any(keyword in text_lower for keyword in [
-            'собственник', 'от собственника', 'без посредников', 
-            'напрямую от собственника', 'хозяин', 'владелец',
-            'от хозяина', 'напрямую', 'без агентств'
-        ]):
-            return "Собственник"
-        return "Агентство"
+        return _find_address(text, element)
+    
+    def _extract_landlord(self, text: str, text_lower: Optional[str] = None) -> str:
+        """Извлечь тип арендодателя (text_lower — уже посчитанный text.lower(), если есть)."""
+        return _find_landlord(text, text_lower)
@@ -0,0 +1,60 @@
+"""Модель объявления, которую возвращают парсеры."""
+from dataclasses import dataclass, fields
+from typing import Any, Dict, Optional
+
+
+@dataclass
+class Listing:
+    """
+    Объявление об аренде.
+    
+    Хранит поля в __slots__ (без __dict__ на каждый объект). Для совместимости с кодом,
+    работающим со словарями объявлений, поддерживает listing['url'], listing.get('rooms')
+    и проверку 'url' in listing.
+    """
+    __slots__ = ('listing_id', 'source', 'address', 'rooms', 'price_byn', 'price_usd', 'landlord', 'url')
+    
+    listing_id: str
+    source: str
+    address: str
+    rooms: Optional[int]
+    price_byn: Optional[float]
+    price_usd: Optional[float]
+    landlord: str
+    url: str
+    
+    def __getitem__(self, key: str) -> Any:
+        if key not in self.__slots__:
+            raise KeyError(key)
+        return getattr(self, key)
+    
+    def __contains__(self, key: object) -> bool:
+        return key in self.__slots__
+    
+    def get(self, key: str, default: Any = None) -> Any:
+        """
+        Получить поле по имени, как dict.get.
+        
+        Args:
+            key: Имя поля
+            default: Значение, если такого поля нет
+        
+        Returns:
+            Any: Значение поля (в том числе None) или default
+        """
+        if key not in self.__slots__:
+            return default
+        return getattr(self, key)
+    
+    def keys(self):
+        """Имена полей (нужны для dict(listing))."""
+        return self.__slots__
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Преобразовать объявление в словарь.
+        
+        Returns:
+            Dict[str, Any]: Поля объявления
+        """
+        return {field.name: getattr(self, field.name) for field in fields(self)}
@@ -1,16 +1,76 @@
 """Парсер для Onliner.by."""
 import re
-import hashlib
+import asyncio
 import logging
-from typing import List, Dict, Optional
-from bs4 import BeautifulSoup
+from typing import Awaitable, Callable, List, Optional
+from bs4 import BeautifulSoup, SoupStrainer
+from lxml import etree, html as lxml_html
 
-from .base import BaseParser
+from .base import BaseParser, make_listing_id, strip_xml_declaration
+from .listing import Listing
 from .selenium_base import SeleniumBaseParser
 from config import settings
 
 logger = logging.getLogger(__name__)
 
+# Регулярки для поиска по class и href компилируются один раз при импорте модуля
+_RE_CLASSIFIED = re.compile(r'classified')
+_RE_APARTMENT_HREF = re.compile(r'/ak/apartments/')
+# Блоки страницы объявления
+_RE_ROOMS_CLASS = re.compile(r'apartment-info__item|classified__param|rooms|room')
+_RE_PRICE_CLASS = re.compile(r'apartment-info__item|classified__price|price')
+_RE_LANDLORD_CLASS = re.compile(r'classified__figure|owner|landlord|agent')
+# Блоки карточки на странице списка
+_RE_PRICE_VALUE_CLASS = re.compile(r'classified__price-value|price')
+_RE_PRICE_PARENT_CLASS = re.compile(r'classified__price')
+_RE_LOCATION_CLASS = re.compile(r'classified__location|address|location')
+_RE_CARD_ROOMS_CLASS = re.compile(r'classified__param|rooms|room|classified__caption-item_type')
+_RE_FIGURE_CLASS = re.compile(r'classified__figure')
+# Служебные ссылки раздела объявлений (создание, редактирование, удаление)
+_SERVICE_HREF_PARTS = ('/create', '/edit', '/delete')
+
+
+def _is_listing_href(href: Optional[str]) -> bool:
+    """Ссылка ведёт на объявление /ak/apartments/, а не на служебную страницу (фильтр href для find_all)."""
+    return bool(href) and '/ak/apartments/' in href and not any(part in href for part in _SERVICE_HREF_PARTS)
+
+
+# Блок цены страницы объявления: есть уже в серверном HTML, без него страница — заглушка или капча
+_DETAIL_MARKER = 'apartment-bar__price-value_primary'
+# Блоки страницы объявления (точное имя класса среди классов элемента, как class_='...' в bs4)
+_XPATH_CLASS = '//{tag}[contains(concat(" ", normalize-space(@class), " "), " {cls} ")]'
+_XPATH_PRICE_USD = etree.XPath(_XPATH_CLASS.format(tag='span', cls='apartment-bar__price-value_complementary'))
+_XPATH_PRICE_BYN = etree.XPath(_XPATH_CLASS.format(tag='span', cls='apartment-bar__price-value_primary'))
+_XPATH_BAR_VALUES = etree.XPath(_XPATH_CLASS.format(tag='span', cls='apartment-bar__value'))
+_XPATH_ADDRESS = etree.XPath(_XPATH_CLASS.format(tag='div', cls='apartment-info__sub-line_large'))
+# Текст страницы без скриптов, стилей и шаблонов — те же строки, что отдаёт get_text() в bs4
+_XPATH_PAGE_TEXT = etree.XPath('//text()[not(ancestor::script or ancestor::style or ancestor::template)]')
+# Карточки объявлений (ссылки с классом classified): первым разбором строим дерево только из них
+_CLASSIFIED_STRAINER = SoupStrainer('a', class_=_RE_CLASSIFIED)
+# Поиск адреса в тексте (Минск, улица...) одной регуляркой: шаблоны "Минск, <3+ символа>"
+# и "г. Минск, ..." находят то же упоминание Минска, что и этот, поэтому отдельно не нужны.
+# Хвост ограничен _ADDRESS_MAX_LEN символами (длиннее всё равно обрезается)
+_ADDRESS_MAX_LEN = 100
+_RE_ADDRESS = re.compile(
+    r'Минск[,\s]+(?:ул\.|улица|пр\.|проспект|пер\.|переулок|бул\.|бульвар)?\s*([А-Яа-я\s\d,.-]{1,100})',
+    re.IGNORECASE
+)
+_RE_MINSK_ADDR = re.compile(r'минск[,\s]+([а-яё\s\d,.-]{5,50})')
+# Слова, по которым объявление считается от собственника, одной альтернацией
+# ("от собственника", "от хозяина", "напрямую от собственника" содержат более короткие слова)
+_RE_OWNER_KEYWORDS = re.compile(r'собственник|без посредников|хозяин|владелец|напрямую|без агентств', re.IGNORECASE)
+
+
+def _node_text(node) -> str:
+    """Текст элемента lxml, как get_text(' ', strip=True) в bs4."""
+    return ' '.join(chunk for chunk in (part.strip() for part in node.itertext()) if chunk)
+
+
+def _first_text(xpath: etree.XPath, tree) -> Optional[str]:
+    """Текст первого элемента, найденного xpath, или None, если элементов нет."""
+    nodes = xpath(tree)
+    return _node_text(nodes[0]) if nodes else None
+
 
 class OnlinerParser(BaseParser):
     """Парсер для Onliner.by с использованием Chromium (общий браузер при передаче selenium_parser)."""
@@ -21,12 +81,23 @@ class OnlinerParser(BaseParser):
         self.selenium_parser = selenium_parser or SeleniumBaseParser(shared=True)
         self._own_selenium = selenium_parser is None
     
-    def __del__(self):
-        """Деструктор — закрываем драйвер только если создавали сами."""
-        if getattr(self, '_own_selenium', True) and hasattr(self, 'selenium_parser'):
+    def close(self) -> None:
+        """Закрыть Chromium, если парсер создавал его сам (переданный снаружи общий браузер не закрывается)."""
+        if self._own_selenium:
             self.selenium_parser.close()
     
-    async def parse_listings(self, url: str) -> List[Dict]:
+    async def aclose(self) -> None:
+        """Закрыть браузер парсера, не блокируя event loop (остановка Chromium — в пуле потоков)."""
+        loop = asyncio.get_event_loop()
+        await loop.run_in_executor(None, self.close)
+    
+    async def __aenter__(self) -> 'OnlinerParser':
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.aclose()
+    
+    async def parse_listings(self, url: str) -> List[Listing]:
         """
         Парсинг объявлений с Onliner.
         
@@ -34,7 +105,7 @@ class OnlinerParser(BaseParser):
             url: URL страницы Onliner
         
         Returns:
-            List[Dict]: Список объявлений
+            List[Listing]: Список объявлений
         """
         # Используем Selenium для получения HTML (динамическая загрузка)
         html = await self.selenium_parser.fetch_page_selenium(url, wait_time=10)
@@ -44,63 +115,53 @@ class OnlinerParser(BaseParser):
         if not html:
             return []
         
-        soup = BeautifulSoup(html, 'lxml')
-        listings = []
+        max_listings = settings.max_listings_per_source
+        
+        # Поиск объявлений на странице - Onliner использует класс "classified".
+        # Сначала разбираем только такие карточки; полное дерево строится,
+        # лишь если их нет и нужен поиск по ссылкам
+        soup = BeautifulSoup(html, 'lxml', parse_only=_CLASSIFIED_STRAINER)
+        listing_containers = soup.find_all('a', class_=_RE_CLASSIFIED, limit=max_listings)
+        
+        full_soup = False
+        if any(not container.get('href') or 'classified' not in container.get('class', [])
+               for container in listing_containers):
+            # Ссылку карточки без href (или не класса classified) ищем и в родительском элементе,
+            # а в урезанном дереве родителей нет — перестраиваем полное дерево
+            soup = BeautifulSoup(html, 'lxml')
+            full_soup = True
+            listing_containers = soup.find_all('a', class_=_RE_CLASSIFIED, limit=max_listings)
         
-        # Поиск объявлений на странице - Onliner использует класс "classified"
-        # Но также можно искать по ссылкам напрямую
-        listing_containers = soup.find_all('a', class_=re.compile(r'classified'))
-        
-        # Если не найдено, ищем по ссылкам на объявления
-        if not listing_containers:
-            # Ищем все ссылки на объявления, исключая служебные
-            links = soup.find_all('a', href=re.compile(r'/ak/apartments/'))
-            # Фильтруем ссылки - исключаем /create, /edit и другие служебные
-            valid_links = [
-                link for link in links 
-                if link.get('href') and 
-                '/create' not in link.get('href', '') and
-                '/edit' not in link.get('href', '') and
-                '/delete' not in link.get('href', '')
-            ]
-            for link in valid_links[:settings.max_listings_per_source]:
-                listing_data = await self._parse_listing_from_link(link, url)
-                if listing_data:
-                    listings.append(listing_data)
-        
-        # Если нашли контейнеры, парсим их
         if listing_containers:
-            for container in listing_containers[:settings.max_listings_per_source]:
-                listing_data = await self._parse_listing_from_container(container, url)
-                if listing_data:
-                    listings.append(listing_data)
-        
-        # Если все еще не найдено, ищем по другим классам
-        if not listing_containers and not listings:
-            # Ищем все ссылки на объявления, исключая служебные
-            links = soup.find_all('a', href=re.compile(r'/ak/apartments/'))
-            # Фильтруем ссылки - исключаем /create, /edit и другие служебные
-            valid_links = [
-                link for link in links 
-                if link.get('href') and 
-                '/create' not in link.get('href', '') and
-                '/edit' not in link.get('href', '') and
-                '/delete' not in link.get('href', '')
-            ]
-            for link in valid_links[:settings.max_listings_per_source]:
-                listing_data = await self._parse_listing_from_link(link, url)
-                if listing_data:
-                    listings.append(listing_data)
+            listings = await self._parse_concurrently(self._parse_listing_from_container, listing_containers, url)
         else:
-            for container in listing_containers[:settings.max_listings_per_source]:
-                listing_data = await self._parse_listing_from_container(container, url)
-                if listing_data:
-                    listings.append(listing_data)
+            # Если карточек нет, ищем ссылки на объявления, исключая служебные;
+            # поиск останавливается на max_listings
+            soup = BeautifulSoup(html, 'lxml')
+            full_soup = True
+            # Повторные ссылки на то же объявление (картинка и заголовок карточки) отсекаются
+            # во время обхода, чтобы limit считал только разные объявления
+            seen_urls = set()
+            
+            def is_new_listing_href(href: Optional[str]) -> bool:
+                if not _is_listing_href(href):
+                    return False
+                href = self._normalize_href(href)
+                if href in seen_urls:
+                    return False
+                seen_urls.add(href)
+                return True
+            
+            valid_links = soup.find_all('a', href=is_new_listing_href, limit=max_listings)
+            listings = await self._parse_concurrently(self._parse_listing_from_link, valid_links, url)
         
         # Если все еще нет объявлений, пробуем более агрессивный поиск
         if not listings:
+            if not full_soup:
+                soup = BeautifulSoup(html, 'lxml')
             # Ищем любые ссылки, содержащие /ak/apartments/ с ID
             all_links = soup.find_all('a', href=True)
+            candidates = []
             for link in all_links:
                 href = link.get('href', '')
                 # Ищем ссылки вида /ak/apartments/123456 или подобные
@@ -108,19 +169,138 @@ class OnlinerParser(BaseParser):
                     # Проверяем, что после /apartments/ есть что-то похожее на ID
                     parts = href.split('/ak/apartments/')
                     if len(parts) > 1 and parts[1].split('/')[0].split('?')[0]:
-                        listing_data = await self._parse_listing_from_link(link, url)
-                        if listing_data and listing_data not in listings:
-                            listings.append(listing_data)
-                            if len(listings) >= settings.max_listings_per_source:
-                                break
+                        candidates.append(link)
+            # Ссылки на одно объявление разбираем один раз
+            candidates = self._unique_links(candidates)
+            # Разбираем пачками ровно столько ссылок, сколько объявлений не хватает
+            while candidates and len(listings) < max_listings:
+                batch = candidates[:max_listings - len(listings)]
+                candidates = candidates[len(batch):]
+                listings.extend(await self._parse_concurrently(self._parse_listing_from_link, batch, url))
         
         return listings
     
+    @staticmethod
+    def _normalize_byn(price_byn: Optional[float], price_usd: Optional[float]) -> Optional[float]:
+        """
+        Перевести цену BYN из копеек в рубли, если она в копейках.
+        
+        Цена считается в копейках, если она больше цены USD в 10 раз (нормальный курс ~3),
+        а без цены USD — если она больше 10000.
+        
+        Args:
+            price_byn: Цена в BYN
+            price_usd: Цена в USD
+        
+        Returns:
+            Optional[float]: Цена в BYN (рубли)
+        """
+        if price_byn is None or price_byn <= 0:
+            return price_byn
+        if price_usd and price_usd > 0:
+            if price_byn > 10 * price_usd:
+                return price_byn / 100
+        elif price_byn > 10000:
+            return price_byn / 100
+        return price_byn
+    
+    @classmethod
+    def _unique_links(cls, links: List) -> List:
+        """Оставить по одной ссылке на каждый нормализованный URL (порядок страницы сохраняется)."""
+        seen_urls = set()
+        unique = []
+        for link in links:
+            href = cls._normalize_href(link.get('href', ''))
+            if href not in seen_urls:
+                seen_urls.add(href)
+                unique.append(link)
+        return unique
+    
+    @staticmethod
+    def _normalize_href(href: str) -> str:
+        """
+        Привести ссылку к абсолютному URL; для объявления — без параметров и якоря.
+        
+        Args:
+            href: Ссылка из атрибута href
+        
+        Returns:
+            str: Нормализованный URL
+        """
+        if not href.startswith('http'):
+            # Убираем дублирующие слеши
+            href = 'https://r.onliner.by/' + href.lstrip('/')
+        # Убираем лишние параметры и фрагменты, оставляем только путь к объявлению
+        parts = href.split('/ak/apartments/')
+        if len(parts) > 1:
+            listing_path = parts[1].split('?')[0].split('#')[0]
+            href = f'https://r.onliner.by/ak/apartments/{listing_path}'
+        return href
+    
+    async def _fetch_listing_page(self, href: str) -> Optional[str]:
+        """
+        Загрузить страницу объявления: сначала обычным запросом, через Chromium — если нужно.
+        
+        Onliner отдаёт данные объявления уже в серверном HTML; Chromium нужен,
+        только если в ответе нет блока цены (ошибка, заглушка, капча).
+        
+        Args:
+            href: URL объявления
+        
+        Returns:
+            Optional[str]: HTML страницы или None, если ни один ответ не похож на страницу объявления
+            (тогда вызывающий код берёт данные из карточки или ссылки)
+        """
+        html = await self.fetch_page(href)
+        if html and _DETAIL_MARKER in html:
+            return html
+        html = await self.selenium_parser.fetch_page_selenium(href, wait_time=8)
+        if html and _DETAIL_MARKER in html:
+            return html
+        return None
+    
+    async def _parse_concurrently(
+        self,
+        parse: Callable[..., Awaitable[Optional[Listing]]],
+        nodes: List,
+        base_url: str
+    ) -> List[Listing]:
+        """
+        Разобрать ссылки или контейнеры объявлений параллельно.
+        
+        Одновременно разбирается не больше settings.onliner_concurrency объявлений: параллельно
+        идут HTTP-загрузки и разбор, а догрузки через общий Chromium выполняются по очереди,
+        каждая со своей паузой перед переходом (см. SeleniumBaseParser._fetch_page_sync).
+        
+        Args:
+            parse: _parse_listing_from_link или _parse_listing_from_container
+            nodes: Ссылки или контейнеры
+            base_url: Базовый URL
+        
+        Returns:
+            List[Listing]: Объявления в порядке nodes (без неудачных)
+        """
+        semaphore = asyncio.BoundedSemaphore(settings.onliner_concurrency)
+        
+        async def parse_node(node) -> Optional[Listing]:
+            async with semaphore:
+                return await parse(node, base_url)
+        
+        results = await asyncio.gather(*(parse_node(node) for node in nodes), return_exceptions=True)
+        listings = []
+        for listing_data in results:
+            if isinstance(listing_data, Exception):
+                logger.warning(f"Ошибка при парсинге объявления Onliner: {listing_data}")
+                continue
+            if listing_data:
+                listings.append(listing_data)
+        return listings
+    
     async def _parse_listing_from_link(
         self,
         link_element,
         base_url: str
-    ) -> Optional[Dict]:
+    ) -> Optional[Listing]:
         """
         Парсинг объявления из ссылки.
         
@@ -129,26 +309,16 @@ class OnlinerParser(BaseParser):
             base_url: Базовый URL
         
         Returns:
-            Optional[Dict]: Данные объявления или None
+            Optional[Listing]: Данные объявления или None
         """
         try:
             href = link_element.get('href', '')
-            if href:
-                if not href.startswith('http'):
-                    # Убираем дублирующие слеши
-                    href = href.lstrip('/')
-                    href = 'https://r.onliner.by/' + href
-                # Убираем лишние параметры, оставляем только путь к объявлению
-                if '/ak/apartments/' in href:
-                    parts = href.split('/ak/apartments/')
-                    if len(parts) > 1:
-                        listing_path = parts[1].split('?')[0].split('#')[0]
-                        href = f'https://r.onliner.by/ak/apartments/{listing_path}'
-            else:
+            if not href:
                 return None
+            href = self._normalize_href(href)
             
             # Пробуем загрузить страницу объявления для более точных данных
-            listing_html = await self.selenium_parser.fetch_page_selenium(href, wait_time=8)
+            listing_html = await self._fetch_listing_page(href)
             if listing_html:
                 listing_soup = BeautifulSoup(listing_html, 'lxml')
                 text = listing_soup.get_text(' ', strip=True)
@@ -160,7 +330,7 @@ class OnlinerParser(BaseParser):
                 landlord = None
                 
                 # Ищем комнаты в специальных элементах Onliner
-                rooms_elems = listing_soup.find_all(class_=re.compile(r'apartment-info__item|classified__param|rooms|room'))
+                rooms_elems = listing_soup.find_all(class_=_RE_ROOMS_CLASS)
                 for room_elem in rooms_elems:
                     room_text = room_elem.get_text(' ', strip=True)
                     rooms = self.extract_rooms(room_text)
@@ -179,7 +349,7 @@ class OnlinerParser(BaseParser):
                     rooms = self.extract_rooms(text)
                 
                 # Ищем цену
-                price_elems = listing_soup.find_all(class_=re.compile(r'apartment-info__item|classified__price|price'))
+                price_elems = listing_soup.find_all(class_=_RE_PRICE_CLASS)
                 for price_elem in price_elems:
                     price_text = price_elem.get_text(' ', strip=True)
                     price_byn, price_usd = self.extract_price(price_text)
@@ -190,19 +360,10 @@ class OnlinerParser(BaseParser):
                     price_byn, price_usd = self.extract_price(text)
                 
                 # Onliner хранит цены в BYN в копейках - конвертируем в рубли
-                if price_byn is not None and price_byn > 0:
-                    # Проверяем соотношение с USD для определения формата
-                    if price_usd and price_usd > 0:
-                        ratio = price_byn / price_usd
-                        # Если соотношение больше 10, вероятно цена в копейках
-                        if ratio > 10:
-                            price_byn = price_byn / 100
-                    elif price_byn > 10000:
-                        # Если цена очень большая и нет USD, вероятно в копейках
-                        price_byn = price_byn / 100
+                price_byn = self._normalize_byn(price_byn, price_usd)
                 
                 # Ищем арендодателя
-                landlord_elems = listing_soup.find_all(class_=re.compile(r'classified__figure|owner|landlord|agent'))
+                landlord_elems = listing_soup.find_all(class_=_RE_LANDLORD_CLASS)
                 for landlord_elem in landlord_elems:
                     classes = landlord_elem.get('class', [])
                     if isinstance(classes, list):
@@ -229,19 +390,10 @@ class OnlinerParser(BaseParser):
                 rooms = self.extract_rooms(text) or self.extract_rooms(str(parent))
                 price_byn, price_usd = self.extract_price(text)
                 # Onliner хранит цены в BYN в копейках - конвертируем в рубли
-                if price_byn is not None and price_byn > 0:
-                    # Проверяем соотношение с USD для определения формата
-                    if price_usd and price_usd > 0:
-                        ratio = price_byn / price_usd
-                        # Если соотношение больше 10, вероятно цена в копейках
-                        if ratio > 10:
-                            price_byn = price_byn / 100
-                    elif price_byn > 10000:
-                        # Если цена очень большая и нет USD, вероятно в копейках
-                        price_byn = price_byn / 100
+                price_byn = self._normalize_byn(price_byn, price_usd)
                 landlord = self._extract_landlord(text)
             
-            listing_id = hashlib.md5(href.encode()).hexdigest()
+            listing_id = make_listing_id(href)
             
             # Если адрес не содержит "Минск", добавляем его
             if address and 'минск' not in address.lower():
@@ -251,16 +403,16 @@ class OnlinerParser(BaseParser):
                 elif not address or address == 'Адрес не указан':
                     address = "Минск"
             
-            return {
-                'listing_id': listing_id,
-                'source': 'Onliner',
-                'address': address or 'Минск',
-                'rooms': rooms,
-                'price_byn': price_byn,
-                'price_usd': price_usd,
-                'landlord': landlord,
-                'url': href
-            }
+            return Listing(
+                listing_id=listing_id,
+                source='Onliner',
+                address=address or 'Минск',
+                rooms=rooms,
+                price_byn=price_byn,
+                price_usd=price_usd,
+                landlord=landlord,
+                url=href
+            )
         except Exception as e:
             logger.error(f"Ошибка парсинга объявления Onliner: {e}")
             return None
@@ -269,7 +421,7 @@ class OnlinerParser(BaseParser):
         self,
         container,
         base_url: str
-    ) -> Optional[Dict]:
+    ) -> Optional[Listing]:
         """
         Парсинг объявления из контейнера.
         
@@ -278,7 +430,7 @@ class OnlinerParser(BaseParser):
             base_url: Базовый URL
         
         Returns:
-            Optional[Dict]: Данные объявления или None
+            Optional[Listing]: Данные объявления или None
         """
         try:
             # Если контейнер - это ссылка с классом 'classified', используем её напрямую
@@ -291,13 +443,13 @@ class OnlinerParser(BaseParser):
                 href = ''
                 
                 # 1. Ищем прямую ссылку в контейнере
-                link = container.find('a', href=re.compile(r'/ak/apartments/'))
+                link = container.find('a', href=_RE_APARTMENT_HREF)
                 if link:
                     href = link.get('href', '')
                 
                 # 2. Если не нашли, ищем в дочерних элементах
                 if not href:
-                    links = container.find_all('a', href=re.compile(r'/ak/apartments/'))
+                    links = container.find_all('a', href=_RE_APARTMENT_HREF)
                     if links:
                         href = links[0].get('href', '')
                 
@@ -311,61 +463,40 @@ class OnlinerParser(BaseParser):
                 if not href:
                     parent = container.find_parent(['div', 'article', 'li'])
                     if parent:
-                        parent_link = parent.find('a', href=re.compile(r'/ak/apartments/'))
+                        parent_link = parent.find('a', href=_RE_APARTMENT_HREF)
                         if parent_link:
                             href = parent_link.get('href', '')
             
             # Формируем полный URL
             if href:
-                if not href.startswith('http'):
-                    # Убираем дублирующие слеши
-                    href = href.lstrip('/')
-                    href = 'https://r.onliner.by/' + href
-                # Убираем лишние параметры и фрагменты, оставляем только путь к объявлению
-                if '/ak/apartments/' in href:
-                    # Берем только путь до объявления
-                    parts = href.split('/ak/apartments/')
-                    if len(parts) > 1:
-                        listing_path = parts[1].split('?')[0].split('#')[0]
-                        href = f'https://r.onliner.by/ak/apartments/{listing_path}'
+                href = self._normalize_href(href)
             
             # Если ссылка все еще не найдена, пропускаем это объявление
             if not href or href == base_url or '/ak/apartments/' not in href:
                 return None
             
-            # Загружаем страницу объявления через Chromium (меньше блокировок)
-            listing_html = await self.fetch_page_prefer_browser(href, wait_time=8)
+            # Загружаем страницу объявления (через Chromium — только если HTTP не отдал разметку)
+            listing_html = await self._fetch_listing_page(href)
             if listing_html:
-                listing_soup = BeautifulSoup(listing_html, 'lxml')
+                # Нужны несколько блоков страницы: хватает дерева lxml, без BeautifulSoup
+                tree = lxml_html.fromstring(strip_xml_declaration(listing_html))
                 
                 # Извлекаем цену из apartment-bar__price-value
                 price_byn, price_usd = None, None
-                price_usd_elem = listing_soup.find('span', class_='apartment-bar__price-value_complementary')
-                if price_usd_elem:
-                    price_usd_text = price_usd_elem.get_text(' ', strip=True)
+                price_usd_text = _first_text(_XPATH_PRICE_USD, tree)
+                if price_usd_text is not None:
                     _, price_usd = self.extract_price(price_usd_text)
                 
-                price_byn_elem = listing_soup.find('span', class_='apartment-bar__price-value_primary')
-                if price_byn_elem:
-                    price_byn_text = price_byn_elem.get_text(' ', strip=True)
+                price_byn_text = _first_text(_XPATH_PRICE_BYN, tree)
+                if price_byn_text is not None:
                     price_byn, _ = self.extract_price(price_byn_text)
                     # Onliner хранит цены в BYN в копейках - конвертируем в рубли
-                    if price_byn is not None and price_byn > 0:
-                        # Проверяем соотношение с USD для определения формата
-                        if price_usd and price_usd > 0:
-                            ratio = price_byn / price_usd
-                            # Если соотношение больше 10, вероятно цена в копейках
-                            if ratio > 10:
-                                price_byn = price_byn / 100
-                        elif price_byn > 10000:
-                            # Если цена очень большая и нет USD, вероятно в копейках
-                            price_byn = price_byn / 100
+                    price_byn = self._normalize_byn(price_byn, price_usd)
                 
                 # Извлекаем комнаты из apartment-bar__value
                 rooms = None
-                bar_values = listing_soup.find_all('span', class_='apartment-bar__value')
-                for bar_value in bar_values:
-                    value_text = bar_value.get_text(' ', strip=True)
+                bar_texts = [_node_text(bar_value) for bar_value in _XPATH_BAR_VALUES(tree)]
+                for value_text in bar_texts:
                     if 'комнатн' in value_text.lower() or 'комн' in value_text.lower():
                         rooms = self.extract_rooms(value_text)
                         if rooms is not None:
@@ -373,8 +504,7 @@ class OnlinerParser(BaseParser):
                 
                 # Извлекаем арендодателя из apartment-bar__value
                 landlord = "Агентство"
-                for bar_value in bar_values:
-                    value_text = bar_value.get_text(' ', strip=True)
+                for value_text in bar_texts:
                     if 'собственник' in value_text.lower():
                         landlord = "Собственник"
                         break
@@ -383,24 +513,23 @@ class OnlinerParser(BaseParser):
                         break
                 
                 # Извлекаем адрес из apartment-info__sub-line_large
-                address = ''
-                address_elem = listing_soup.find('div', class_='apartment-info__sub-line_large')
-                if address_elem:
-                    address = address_elem.get_text(' ', strip=True)
+                address = _first_text(_XPATH_ADDRESS, tree) or ''
                 
                 if not address:
-                    address = self._extract_address(listing_soup.get_text(' ', strip=True), listing_soup)
+                    # У корня страницы нет data-атрибутов адреса: ищем только по тексту
+                    page_text = ' '.join(chunk for chunk in (part.strip() for part in _XPATH_PAGE_TEXT(tree)) if chunk)
+                    address = self._extract_address(page_text, None)
             else:
                 # Если не удалось загрузить страницу, используем данные из контейнера
                 text = container.get_text(' ', strip=True)
                 
                 # Улучшенное извлечение цены - Onliner использует classified__price-value
                 price_byn, price_usd = None, None
-                price_elements = container.find_all(class_=re.compile(r'classified__price-value|price'))
+                price_elements = container.find_all(class_=_RE_PRICE_VALUE_CLASS)
                 for price_elem in price_elements:
                     price_text = price_elem.get_text(' ', strip=True)
                     # Проверяем наличие валюты в родительском элементе
-                    parent_price = price_elem.find_parent(class_=re.compile(r'classified__price'))
+                    parent_price = price_elem.find_parent(class_=_RE_PRICE_PARENT_CLASS)
                     if parent_price:
                         parent_text = parent_price.get_text(' ', strip=True)
                         price_byn, price_usd = self.extract_price(parent_text)
@@ -414,20 +543,11 @@ class OnlinerParser(BaseParser):
                     price_byn, price_usd = self.extract_price(text)
                 
                 # Onliner хранит цены в BYN в копейках - конвертируем в рубли
-                if price_byn is not None and price_byn > 0:
-                    # Проверяем соотношение с USD для определения формата
-                    if price_usd and price_usd > 0:
-                        ratio = price_byn / price_usd
-                        # Если соотношение больше 10, вероятно цена в копейках
-                        if ratio > 10:
-                            price_byn = price_byn / 100
-                    elif price_byn > 10000:
-                        # Если цена очень большая и нет USD, вероятно в копейках
-                        price_byn = price_byn / 100
+                price_byn = self._normalize_byn(price_byn, price_usd)
                 
                 # Улучшенное извлечение адреса - ищем в специальных элементах
                 address = ''
-                address_elem = container.find(class_=re.compile(r'classified__location|address|location'))
+                address_elem = container.find(class_=_RE_LOCATION_CLASS)
                 if address_elem:
                     address = address_elem.get_text(' ', strip=True)
                 
@@ -436,7 +556,7 @@ class OnlinerParser(BaseParser):
                 
                 # Улучшенное извлечение комнат - ищем в тексте и специальных элементах
                 rooms = None
-                rooms_elem = container.find(class_=re.compile(r'classified__param|rooms|room|classified__caption-item_type'))
+                rooms_elem = container.find(class_=_RE_CARD_ROOMS_CLASS)
                 if rooms_elem:
                     rooms_text = rooms_elem.get_text(' ', strip=True)
                     rooms = self.extract_rooms(rooms_text)
@@ -446,7 +566,7 @@ class OnlinerParser(BaseParser):
                 
                 # Улучшенное извлечение арендодателя - проверяем класс classified__figure_agent
                 landlord = None
-                figure_elem = container.find(class_=re.compile(r'classified__figure'))
+                figure_elem = container.find(class_=_RE_FIGURE_CLASS)
                 if figure_elem:
                     # Если есть класс classified__figure_agent, значит это агентство
                     # Если нет - возможно собственник
@@ -466,7 +586,7 @@ class OnlinerParser(BaseParser):
                 if not landlord:
                     landlord = "Собственник"
             
-            listing_id = hashlib.md5(href.encode()).hexdigest()
+            listing_id = make_listing_id(href)
             
             # Если адрес не содержит "Минск", добавляем его
             if address and 'минск' not in address.lower():
@@ -476,16 +596,16 @@ class OnlinerParser(BaseParser):
                 elif not address or address == 'Адрес не указан':
                     address = "Минск"
             
-            return {
-                'listing_id': listing_id,
-                'source': 'Onliner',
-                'address': address or 'Минск',
-                'rooms': rooms,
-                'price_byn': price_byn,
-                'price_usd': price_usd,
-                'landlord': landlord,
-                'url': href
-            }
+            return Listing(
+                listing_id=listing_id,
+                source='Onliner',
+                address=address or 'Минск',
+                rooms=rooms,
+                price_byn=price_byn,
+                price_usd=price_usd,
+                landlord=landlord,
+                url=href
+            )
         except Exception as e:
             logger.error(f"Ошибка парсинга контейнера Onliner: {e}")
             return None
@@ -502,20 +622,13 @@ class OnlinerParser(BaseParser):
             str: Адрес или пустая строка
         """
         # Поиск адреса в тексте (Минск, улица...)
-        address_patterns = [
-            r'Минск[,\s]+(?:ул\.|улица|пр\.|проспект|пер\.|переулок|бул\.|бульвар)?\s*([А-Яа-я\s\d,.-]+)',
-            r'Минск[,\s]+([А-Яа-я\s\d,.-]{3,})',  # Более общий паттерн
-            r'г\.?\s*Минск[,\s]+([А-Яа-я\s\d,.-]+)',
-        ]
-        
-        for pattern in address_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                address_part = match.group(1).strip()
-                # Ограничиваем длину адреса
-                if len(address_part) > 100:
-                    address_part = address_part[:100]
-                return f"Минск, {address_part}"
+        match = _RE_ADDRESS.search(text)
+        if match:
+            address_part = match.group(1).strip()
+            # Ограничиваем длину адреса
+            if len(address_part) > _ADDRESS_MAX_LEN:
+                address_part = address_part[:_ADDRESS_MAX_LEN]
+            return f"Минск, {address_part}"
         
         # Попробуем найти через data-атрибуты
         if hasattr(element, 'get'):
@@ -524,9 +637,10 @@ class OnlinerParser(BaseParser):
                 return address_attr
         
         # Если просто упоминается Минск, возвращаем базовый адрес
-        if 'минск' in text.lower():
+        text_lower = text.lower()
+        if 'минск' in text_lower:
             # Пытаемся найти что-то после Минска
-            minsk_match = re.search(r'минск[,\s]+([а-яё\s\d,.-]{5,50})', text.lower())
+            minsk_match = _RE_MINSK_ADDR.search(text_lower)
             if minsk_match:
                 return f"Минск, {minsk_match.group(1).strip().title()}"
             return "Минск"
@@ -543,11 +657,6 @@ class OnlinerParser(BaseParser):
         Returns:
             str: "Собственник" или "Агентство"
         """
-        text_lower = text.lower()
-        if any(keyword in text_lower for keyword in [
-            'собственник', 'от собственника', 'без посредников',
-            'напрямую от собственника', 'хозяин', 'владелец',
-            'от хозяина', 'напрямую', 'без агентств'
-        ]):
+        if _RE_OWNER_KEYWORDS.search(text):
             return "Собственник"
         return "Агентство"
@@ -1,11 +1,11 @@
 """Парсер для Realt.by."""
 import re
-import hashlib
 import logging
-from typing import List, Dict, Optional
+from typing import List, Optional
 from bs4 import BeautifulSoup
 
-from .base import BaseParser
+from .base import BaseParser, make_listing_id
+from .listing import Listing
 from config import settings
 
 logger = logging.getLogger(__name__)
@@ -17,7 +17,7 @@ class RealtParser(BaseParser):
     def __init__(self, selenium_parser=None):
         super().__init__(selenium_parser=selenium_parser)
     
-    async def parse_listings(self, url: str) -> List[Dict]:
+    async def parse_listings(self, url: str) -> List[Listing]:
         """
         Парсинг объявлений с Realt.by.
         
@@ -25,7 +25,7 @@ class RealtParser(BaseParser):
             url: Базовый URL Realt.by
         
         Returns:
-            List[Dict]: Список объявлений
+            List[Listing]: Список объявлений
         """
         # URL для аренды квартир в Минске
         search_url = f"{url}rent/flat/minsk"
@@ -132,7 +132,7 @@ class RealtParser(BaseParser):
         self,
         link_element,
         base_url: str
-    ) -> Optional[Dict]:
+    ) -> Optional[Listing]:
         """Парсинг объявления из ссылки."""
         try:
             href = link_element.get('href', '')
@@ -321,18 +321,18 @@ class RealtParser(BaseParser):
                 price_byn, price_usd = self.extract_price(text)
                 landlord = self._extract_landlord(text)
             
-            listing_id = hashlib.md5(href.encode()).hexdigest()
+            listing_id = make_listing_id(href)
             
-            return {
-                'listing_id': listing_id,
-                'source': 'Realt.by',
-                'address': address or 'Адрес не указан',
-                'rooms': rooms,
-                'price_byn': price_byn,
-                'price_usd': price_usd,
-                'landlord': landlord,
-                'url': href
-            }
+            return Listing(
+                listing_id=listing_id,
+                source='Realt.by',
+                address=address or 'Адрес не указан',
+                rooms=rooms,
+                price_byn=price_byn,
+                price_usd=price_usd,
+                landlord=landlord,
+                url=href
+            )
         except Exception as e:
             logger.error(f"Ошибка парсинга объявления Realt.by: {e}")
             return None
@@ -341,7 +341,7 @@ class RealtParser(BaseParser):
         self,
         container,
         base_url: str
-    ) -> Optional[Dict]:
+    ) -> Optional[Listing]:
         """Парсинг объявления из контейнера."""
         try:
             text = container.get_text(' ', strip=True)
@@ -472,18 +472,18 @@ class RealtParser(BaseParser):
             # Улучшенное извлечение арендодателя
             landlord = self._extract_landlord(text)
             
-            listing_id = hashlib.md5(href.encode()).hexdigest()
+            listing_id = make_listing_id(href)
             
-            return {
-                'listing_id': listing_id,
-                'source': 'Realt.by',
-                'address': address or 'Адрес не указан',
-                'rooms': rooms,
-                'price_usd': price_usd,
-                'price_byn': price_byn,
-                'landlord': landlord,
-                'url': href
-            }
+            return Listing(
+                listing_id=listing_id,
+                source='Realt.by',
+                address=address or 'Адрес не указан',
+                rooms=rooms,
+                price_usd=price_usd,
+                price_byn=price_byn,
+                landlord=landlord,
+                url=href
+            )
         except Exception as e:
             logger.error(f"Ошибка парсинга контейнера Realt.by: {e}")
             return None
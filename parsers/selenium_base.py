@@ -2,6 +2,7 @@
 import asyncio
 import logging
 import random
+import threading
 import time
 from typing import Optional
 from selenium import webdriver
@@ -24,6 +25,11 @@ class SeleniumBaseParser:
     
     _shared_driver: Optional[webdriver.Chrome] = None
     _shared_ref_count: int = 0
+    # Один драйвер не может загружать несколько страниц одновременно
+    _shared_lock = threading.Lock()
+    # Очередь к общему драйверу в цикле событий: в пул потоков передаётся не больше одной
+    # загрузки на драйвер, остальные ждут здесь и отменяются, не занимая поток
+    _shared_gate: Optional[asyncio.Lock] = None
     
     def __init__(self, shared: bool = True) -> None:
         """
@@ -34,6 +40,8 @@ class SeleniumBaseParser:
         """
         self._own_driver = not shared
         self.driver: Optional[webdriver.Chrome] = None
+        self._lock = SeleniumBaseParser._shared_lock if shared else threading.Lock()
+        self._gate: Optional[asyncio.Lock] = None
         if shared:
             self._use_shared_driver()
         else:
@@ -90,13 +98,29 @@ class SeleniumBaseParser:
             logger.error(f"Ошибка при настройке WebDriver: {e}")
             self.driver = None
     
-    async def fetch_page_selenium(self, url: str, wait_time: int = 5) -> Optional[str]:
+    def _driver_gate(self) -> asyncio.Lock:
+        """Очередь asyncio к драйверу: общая для общего драйвера, своя для собственного."""
+        if getattr(self, '_own_driver', True):
+            if self._gate is None:
+                self._gate = asyncio.Lock()
+            return self._gate
+        if SeleniumBaseParser._shared_gate is None:
+            SeleniumBaseParser._shared_gate = asyncio.Lock()
+        return SeleniumBaseParser._shared_gate
+    
+    async def fetch_page_selenium(
+        self,
+        url: str,
+        wait_time: int = 5,
+        cancelled: Optional[threading.Event] = None
+    ) -> Optional[str]:
         """
         Получить HTML страницы через Chromium (меньше блокировок, чем обычные HTTP-запросы).
         
         Args:
             url: URL страницы для получения
             wait_time: Время ожидания загрузки страницы (в секундах)
+            cancelled: Событие отмены: если оно установлено до перехода, страница не загружается
         
         Returns:
             Optional[str]: HTML содержимое страницы или None при ошибке
@@ -110,23 +134,41 @@ class SeleniumBaseParser:
                 return None
         
         try:
-            # Небольшая случайная задержка между запросами — меньше похоже на бота
-            delay = random.uniform(0.5, 2.0)
-            await asyncio.sleep(delay)
-            loop = asyncio.get_event_loop()
-            html = await loop.run_in_executor(
-                None,
-                self._fetch_page_sync,
-                url,
-                wait_time
-            )
+            async with self._driver_gate():
+                if cancelled is not None and cancelled.is_set():
+                    return None
+                loop = asyncio.get_event_loop()
+                html = await loop.run_in_executor(
+                    None,
+                    self._fetch_page_sync,
+                    url,
+                    wait_time,
+                    cancelled
+                )
             return html
         except Exception as e:
             logger.error(f"Ошибка при получении страницы {url} через Chromium: {e}")
             return None
     
-    def _fetch_page_sync(self, url: str, wait_time: int) -> Optional[str]:
-        """Синхронный метод для получения страницы."""
+    def _fetch_page_sync(
+        self,
+        url: str,
+        wait_time: int,
+        cancelled: Optional[threading.Event] = None
+    ) -> Optional[str]:
+        """Синхронный метод для получения страницы (запросы к одному драйверу выполняются по очереди)."""
+        with self._lock:
+            # Загрузка, отменённая, пока ждала драйвер, уже не нужна — не переходим
+            if cancelled is not None and cancelled.is_set():
+                return None
+            # Небольшая случайная задержка между запросами — меньше похоже на бота.
+            # Выдерживается под блокировкой драйвера, чтобы параллельные вызовы не ждали её
+            # одновременно и переходы не шли в браузере подряд без паузы
+            time.sleep(random.uniform(0.5, 2.0))
+            return self._load_page(url, wait_time)
+    
+    def _load_page(self, url: str, wait_time: int) -> Optional[str]:
+        """Загрузить страницу в драйвере и вернуть HTML."""
         try:
             if not self.driver:
                 return None
@@ -137,7 +179,6 @@ class SeleniumBaseParser:
                 EC.presence_of_element_located((By.TAG_NAME, "body"))
             )
             # Дополнительное ожидание для динамического контента
-            import time
             time.sleep(3)  # Увеличиваем время для загрузки динамического контента
             
             # Прокручиваем страницу вниз для загрузки динамического контента (для Kufar и подобных)